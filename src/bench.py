@@ -0,0 +1,53 @@
+"""Benchmark alternative solutions against the originals on large synthetic inputs.
+
+Usage (from the `src` directory): python bench.py 02b 05a 05b
+
+Each argument names a benchmark, which generates its input and then times each solution on it,
+checking that they all give the same answer.
+"""
+import sys
+
+from day_02 import day_02b, day_02b_v2
+from day_05 import day_05a, day_05a_v2, day_05b, day_05b_v2
+from utilities.synthetic import get_synthetic_input, get_synthetic_reports
+from utilities.timer import timer
+
+
+def check_answers(answers: list) -> None:
+    """Raise an error if the solutions being compared gave different answers."""
+    if len(set(answers)) > 1:
+        raise ValueError(f"Solutions gave different answers: {answers}")
+
+
+def benchmark_day_02b(no_reports: int = 20, report_length: int = 1_000) -> None:
+    """Compare the original and single-pass dampener checks on long synthetic reports."""
+    reports = get_synthetic_reports(no_reports, report_length)
+    check_answers([timer(day_02b)(reports), timer(day_02b_v2)(reports)])
+
+
+def benchmark_day_05a(no_pages: int = 2_000, no_updates: int = 20, update_length: int = 1_000) -> None:
+    """Compare the update validators on long updates against a large rule set."""
+    ordering_rules, updates = get_synthetic_input(no_pages, no_updates, update_length)
+    check_answers([
+        timer(day_05a)(ordering_rules, updates),
+        timer(day_05a_v2)(ordering_rules, updates),
+        timer(day_05a_v2)(ordering_rules, updates, use_bitsets=True),
+    ])
+
+
+def benchmark_day_05b(no_pages: int = 500, no_updates: int = 20, update_length: int = 300) -> None:
+    """Compare the comparison sort and topological corrections on long updates."""
+    ordering_rules, updates = get_synthetic_input(no_pages, no_updates, update_length)
+    check_answers([timer(day_05b)(ordering_rules, updates), timer(day_05b_v2)(ordering_rules, updates)])
+
+
+BENCHMARKS = {
+    "02b": benchmark_day_02b,
+    "05a": benchmark_day_05a,
+    "05b": benchmark_day_05b,
+}
+
+
+if __name__ == "__main__":
+    for name in sys.argv[1:] or BENCHMARKS:
+        BENCHMARKS[name]()
@@ -1,14 +1,19 @@
 from collections import Counter
+from collections.abc import Iterable, Iterator
+
+from utilities.parsing import read_ints, stream_int_lines
+from utilities.runs import get_total_distance
 
 
 def get_day_01_input() -> tuple[list[int], list[int]]:
-    with open("inputs/input_01.txt") as f:
-        contents = f.readlines()
+    values = read_ints("inputs/input_01.txt", fields=2)
+    return values[0::2].tolist(), values[1::2].tolist()
+
 
-    pairs_as_str = [line.strip().split("   ") for line in contents]
-    pairs = [(int(a), int(b)) for a, b in pairs_as_str]
-    list1, list2 = zip(*pairs)
-    return list(list1), list(list2)
+def iter_day_01_input() -> Iterator[tuple[int, int]]:
+    """Lazily read the pairs of location IDs, one line at a time."""
+    for a, b in stream_int_lines("inputs/input_01.txt"):
+        yield a, b
 
 
 def day_01a():
@@ -31,6 +36,19 @@ def day_01b():
     return similarity_score
 
 
+def day_01_streaming(pairs: Iterable[tuple[int, int]]) -> tuple[int, int]:
+    """Solve both parts in a single pass over the pairs, holding only the counts of each value in memory."""
+    counts1 = Counter()
+    counts2 = Counter()
+    for a, b in pairs:
+        counts1[a] += 1
+        counts2[b] += 1
+
+    total_distance = get_total_distance(sorted(counts1.items()), sorted(counts2.items()))
+    similarity_score = sum(num * count * counts2[num] for num, count in counts1.items())
+    return total_distance, similarity_score
+
+
 if __name__ == "__main__":
     answer_01a = day_01a()
     print(answer_01a)
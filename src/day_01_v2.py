@@ -0,0 +1,81 @@
+"""Vectorised solution to day 1 using NumPy, answering both parts from a single parse of the input.
+
+When the location IDs span a small enough range, both lists are reduced to counts per value with `np.bincount`,
+which gives a counting sort for the distances and a direct join for the similarity score.
+Otherwise the lists are sorted with `np.sort` and joined on their distinct values with `np.unique`.
+Sums are estimated in floating point first, and worked out with Python ints instead of int64 if they could overflow.
+"""
+import numpy as np
+
+from utilities.parsing import read_ints_as_numpy
+
+COUNTING_SORT_MAX_RANGE = 1 << 24  # widest range of values to count (memory is 8 bytes per value in the range)
+INT64_SAFE_LIMIT = 1 << 62  # comfortably below the int64 maximum, allowing for rounding in the float estimates
+
+
+def get_day_01_input() -> tuple[np.ndarray, np.ndarray]:
+    pairs = read_ints_as_numpy("inputs/input_01.txt", fields=2)
+    return pairs[:, 0], pairs[:, 1]
+
+
+def get_total_distance(sorted1: np.ndarray, sorted2: np.ndarray) -> int:
+    estimate = np.abs(sorted1.astype(np.float64) - sorted2.astype(np.float64)).sum()
+    if estimate < INT64_SAFE_LIMIT:
+        return int(np.abs(sorted1 - sorted2).sum())
+    return int(np.abs(sorted1.astype(object) - sorted2.astype(object)).sum())
+
+
+def get_similarity_score(values: np.ndarray, counts1: np.ndarray, counts2: np.ndarray) -> int:
+    estimate = (np.abs(values.astype(np.float64)) * counts1 * counts2).sum()
+    if estimate < INT64_SAFE_LIMIT:
+        return int((values * counts1 * counts2).sum())
+    in_both = (counts1 > 0) & (counts2 > 0)
+    return int((values[in_both].astype(object) * counts1[in_both] * counts2[in_both]).sum())
+
+
+def solve_by_counting(list1: np.ndarray, list2: np.ndarray, low: int, high: int) -> tuple[int, int]:
+    """Solve both parts from the count of each value, for values in the range `low` to `high`."""
+    values = np.arange(low, high + 1)
+    counts1 = np.bincount(list1 - low, minlength=len(values))
+    counts2 = np.bincount(list2 - low, minlength=len(values))
+
+    sorted1 = np.repeat(values, counts1)  # counting sort
+    sorted2 = np.repeat(values, counts2)
+    total_distance = get_total_distance(sorted1, sorted2)
+
+    similarity_score = get_similarity_score(values, counts1, counts2)
+    return total_distance, similarity_score
+
+
+def solve_by_sorting(list1: np.ndarray, list2: np.ndarray) -> tuple[int, int]:
+    """Solve both parts by sorting, for values spread over too wide a range to count."""
+    sorted1 = np.sort(list1)
+    sorted2 = np.sort(list2)
+    total_distance = get_total_distance(sorted1, sorted2)
+
+    values1, counts1 = np.unique(sorted1, return_counts=True)
+    values2, counts2 = np.unique(sorted2, return_counts=True)
+    idx = np.searchsorted(values2, values1).clip(max=len(values2) - 1)  # where each value in list 1 is in list 2
+    counts1_in_2 = np.where(values2[idx] == values1, counts2[idx], 0)
+    similarity_score = get_similarity_score(values1, counts1, counts1_in_2)
+    return total_distance, similarity_score
+
+
+def day_01_v2(list1: np.ndarray, list2: np.ndarray) -> tuple[int, int]:
+    if len(list1) != len(list2):
+        raise ValueError("Lists must be the same length")
+    if len(list1) == 0:
+        return 0, 0
+
+    low = int(min(list1.min(), list2.min()))
+    high = int(max(list1.max(), list2.max()))
+    if high - low < COUNTING_SORT_MAX_RANGE:
+        return solve_by_counting(list1, list2, low, high)
+    return solve_by_sorting(list1, list2)
+
+
+if __name__ == "__main__":
+    day_01_input = get_day_01_input()
+    answer_01a, answer_01b = day_01_v2(*day_01_input)
+    print(answer_01a)
+    print(answer_01b)
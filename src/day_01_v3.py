@@ -0,0 +1,70 @@
+"""Parallel solution to day 1, splitting the input file into chunks handled by separate processes.
+
+Each worker parses its own byte range of the file and summarises each list as sorted runs of `(value, count)`,
+i.e. a sorted histogram. The partial histograms are combined with a k-way merge, from which both answers follow,
+so the work left for the main process depends on the number of distinct values rather than the number of lines.
+"""
+import heapq
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+
+from utilities.parallel import CHUNKS_PER_WORKER, get_line_aligned_ranges, get_worker_count, read_range
+from utilities.parsing import extract_ints
+from utilities.runs import get_total_distance
+
+type Runs = list[tuple[int, int]]
+
+
+def summarise_chunk(filepath: str, start: int, end: int) -> tuple[Runs, Runs]:
+    """Parse the pairs in the given byte range of the file, returning each list as sorted runs."""
+    values = extract_ints(read_range(filepath, start, end))
+    if len(values) % 2 != 0:
+        raise ValueError(f"Chunk from byte {start} to {end} does not contain whole pairs")
+
+    runs1 = sorted(Counter(values[0::2]).items())
+    runs2 = sorted(Counter(values[1::2]).items())
+    return runs1, runs2
+
+
+def merge_runs(runs_per_chunk: Iterable[Runs]) -> Iterator[tuple[int, int]]:
+    """Merge sorted runs from each chunk into a single sequence of sorted runs, combining runs of the same value."""
+    current_value, current_count = None, 0
+    for value, count in heapq.merge(*runs_per_chunk):
+        if value == current_value:
+            current_count += count
+        else:
+            if current_count:
+                yield current_value, current_count
+            current_value, current_count = value, count
+    if current_count:
+        yield current_value, current_count
+
+
+def get_similarity_score(runs1: Runs, runs2: Runs) -> int:
+    """Calculate the similarity score from each list's sorted runs."""
+    counts2 = dict(runs2)
+    return sum(value * count * counts2.get(value, 0) for value, count in runs1)
+
+
+def day_01_v3(filepath: str = "inputs/input_01.txt", max_workers: int | None = None) -> tuple[int, int]:
+    workers = get_worker_count(max_workers)
+    ranges = get_line_aligned_ranges(filepath, workers * CHUNKS_PER_WORKER)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        summaries = list(executor.map(summarise_chunk, *zip(*[(filepath, start, end) for start, end in ranges])))
+
+    runs1 = list(merge_runs(runs1 for runs1, __ in summaries))
+    runs2 = list(merge_runs(runs2 for __, runs2 in summaries))
+    if sum(count for __, count in runs1) != sum(count for __, count in runs2):
+        raise ValueError("Lists must be the same length")
+
+    total_distance = get_total_distance(runs1, runs2)
+    similarity_score = get_similarity_score(runs1, runs2)
+    return total_distance, similarity_score
+
+
+if __name__ == "__main__":
+    answer_01a, answer_01b = day_01_v3()
+    print(answer_01a)
+    print(answer_01b)
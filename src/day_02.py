@@ -1,11 +1,19 @@
-def get_day_02_input() -> list[list[int]]:
-    with open("inputs/input_02.txt") as f:
-        contents = f.readlines()
+from collections.abc import Iterable, Iterator
+
+from utilities.parsing import read_int_lines, stream_int_lines
+
 
-    reports = [[int(x) for x in line.split(" ")] for line in contents]
+def get_day_02_input() -> list[list[int]]:
+    reports = [report.tolist() for report in read_int_lines("inputs/input_02.txt")]
     return reports
 
 
+def iter_day_02_input() -> Iterator[list[int]]:
+    """Lazily read the reports, one line at a time."""
+    for report in stream_int_lines("inputs/input_02.txt"):
+        yield report.tolist()
+
+
 def is_report_safe(report):
     steps = [level2 - level1 for level1, level2 in zip(report[:-1], report[1:])]
     increasing = all(step in (1, 2, 3) for step in steps)
@@ -14,7 +22,7 @@ def is_report_safe(report):
     return is_safe
 
 
-def day_02a(reports: list[list[int]]) -> int:
+def day_02a(reports: Iterable[list[int]]) -> int:
     return sum(
         (
             all(
@@ -38,17 +46,15 @@ def get_modified_reports(report: list[int]) -> list[list[int]]:
     return modified_reports
 
 
-def day_02b(reports: list[list[int]]) -> int:
-    statuses = []
+def day_02b(reports: Iterable[list[int]]) -> int:
+    safe_count = 0  # count as we go rather than keeping a status per report, so reports can be streamed
     for report in reports:
         is_safe = is_report_safe(report)
         if is_safe:
-            statuses.append(True)
+            safe_count += 1
         elif any(is_report_safe(mr) for mr in get_modified_reports(report)):
-            statuses.append(True)
-        else:
-            statuses.append(False)
-    return sum(statuses)
+            safe_count += 1
+    return safe_count
 
 
 def day_02b_one_line_with_safe_function(reports: list[list[int]]) -> int:
@@ -97,9 +103,56 @@ def day_02b_one_line(reports: list[list[int]]) -> int:
     )
 
 
+STEP_RANGES = ((1, 3), (-3, -1))  # (smallest, largest) allowed step for increasing and decreasing reports
+
+
+def is_safe_without(report: list[int], skip: int, smallest: int, largest: int) -> bool:
+    """Check whether a report is safe in one direction with the level at index `skip` removed.
+
+    Only the steps from just before `skip` onwards are checked, since the steps before that are assumed to be safe.
+
+    """
+    previous = None
+    for i in range(max(skip - 1, 0), len(report)):
+        if i == skip:
+            continue
+        level = report[i]
+        if previous is not None and not smallest <= level - previous <= largest:
+            return False
+        previous = level
+    return True
+
+
+def is_report_safe_with_dampener(report: list[int]) -> bool:
+    """Check whether a report is safe with at most one level removed, without building modified reports.
+
+    For each direction, find the first unsafe step. Removing any level other than the two either side of it
+    leaves that step in place, so only those two removals need trying, each checked from the unsafe step onwards.
+
+    """
+    for smallest, largest in STEP_RANGES:
+        unsafe_step = next(
+            (i for i in range(len(report) - 1) if not smallest <= report[i + 1] - report[i] <= largest), None
+        )
+        if unsafe_step is None:
+            return True
+        if (
+            is_safe_without(report, unsafe_step, smallest, largest)
+            or is_safe_without(report, unsafe_step + 1, smallest, largest)
+        ):
+            return True
+    return False
+
+
+def day_02b_v2(reports: Iterable[list[int]]) -> int:
+    return sum(is_report_safe_with_dampener(report) for report in reports)
+
+
 if __name__ == "__main__":
     day_02_input = get_day_02_input()
     answer_02a = day_02a(day_02_input)
     print(answer_02a)
     answer_02b = day_02b(day_02_input)
     print(answer_02b)
+    answer_02b_v2 = day_02b_v2(day_02_input)
+    print(answer_02b_v2)
@@ -0,0 +1,89 @@
+"""Vectorised solution to day 2 using NumPy, evaluating all reports at once.
+
+The ragged reports are packed into a 2D array padded with zeros, with the length of each report kept alongside.
+Steps that run into the padding are masked out by treating them as safe, so every check is a whole-array operation.
+"""
+import itertools
+from collections.abc import Sequence
+
+import numpy as np
+
+from utilities.parsing import read_int_lines
+
+STEP_RANGES = ((1, 3), (-3, -1))  # (smallest, largest) allowed step for increasing and decreasing reports
+
+
+def pack_reports(reports: Sequence[Sequence[int]]) -> tuple[np.ndarray, np.ndarray]:
+    """Pack reports into a 2D array of levels (one row per report, padded with zeros) and an array of lengths."""
+    lengths = np.fromiter((len(report) for report in reports), dtype=np.int64, count=len(reports))
+    flat = np.fromiter(itertools.chain.from_iterable(reports), dtype=np.int64, count=lengths.sum())
+
+    starts = np.cumsum(lengths) - lengths  # index in `flat` of the first level of each report
+    rows = np.repeat(np.arange(len(reports)), lengths)
+    cols = np.arange(len(flat)) - np.repeat(starts, lengths)
+
+    levels = np.zeros((len(reports), max(lengths.max(initial=0), 1)), dtype=np.int64)
+    levels[rows, cols] = flat
+    return levels, lengths
+
+
+def get_day_02_input() -> tuple[np.ndarray, np.ndarray]:
+    return pack_reports(read_int_lines("inputs/input_02.txt"))
+
+
+def get_safe_steps(steps: np.ndarray, step_exists: np.ndarray, smallest: int, largest: int) -> np.ndarray:
+    """Flag each step as safe if it's within range, or if it's padding (which never makes a report unsafe)."""
+    return ((steps >= smallest) & (steps <= largest)) | ~step_exists
+
+
+def day_02a_v2(levels: np.ndarray, lengths: np.ndarray) -> int:
+    steps = np.diff(levels, axis=1)
+    step_exists = np.arange(steps.shape[1]) < (lengths - 1)[:, np.newaxis]
+
+    is_safe = np.zeros(len(levels), dtype=bool)
+    for smallest, largest in STEP_RANGES:
+        is_safe |= get_safe_steps(steps, step_exists, smallest, largest).all(axis=1)
+    return int(is_safe.sum())
+
+
+def day_02b_v2(levels: np.ndarray, lengths: np.ndarray) -> int:
+    """Count safe reports, allowing one level to be removed, for every possible removal at once.
+
+    Removing level `k` keeps steps `0` to `k - 2` and `k + 1` onwards, and adds a bridging step from level `k - 1`
+    to level `k + 1`. Running "all safe so far" reductions from each end give the kept steps for every `k` together.
+    Removing a level in the padding leaves the report unchanged, which covers reports that are already safe.
+
+    """
+    no_reports, width = levels.shape
+    steps = np.diff(levels, axis=1)  # step j goes from level j to level j + 1
+    step_exists = np.arange(width - 1) < (lengths - 1)[:, np.newaxis]
+    bridges = levels[:, 2:] - levels[:, :-2]  # bridge j goes from level j to level j + 2, replacing level j + 1
+    bridge_exists = np.arange(1, width - 1) < (lengths - 1)[:, np.newaxis]
+
+    removals = np.arange(width)
+    before_removal = np.maximum(removals - 1, 0)
+    after_removal = np.minimum(removals + 1, width - 1)
+
+    is_safe = np.zeros(no_reports, dtype=bool)
+    for smallest, largest in STEP_RANGES:
+        safe_steps = get_safe_steps(steps, step_exists, smallest, largest)
+
+        safe_up_to = np.ones((no_reports, width), dtype=bool)  # [:, j] is whether steps before j are all safe
+        safe_up_to[:, 1:] = np.logical_and.accumulate(safe_steps, axis=1)
+        safe_from = np.ones((no_reports, width), dtype=bool)  # [:, j] is whether steps from j onwards are all safe
+        safe_from[:, :-1] = np.logical_and.accumulate(safe_steps[:, ::-1], axis=1)[:, ::-1]
+        safe_bridge = np.ones((no_reports, width), dtype=bool)  # [:, k] is whether the bridge over level k is safe
+        safe_bridge[:, 1:-1] = get_safe_steps(bridges, bridge_exists, smallest, largest)
+
+        safe_with_removal = safe_up_to[:, before_removal] & safe_bridge & safe_from[:, after_removal]
+        is_safe |= safe_with_removal.any(axis=1)
+
+    return int(is_safe.sum())
+
+
+if __name__ == "__main__":
+    day_02_input = get_day_02_input()
+    answer_02a = day_02a_v2(*day_02_input)
+    print(answer_02a)
+    answer_02b = day_02b_v2(*day_02_input)
+    print(answer_02b)
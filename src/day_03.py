@@ -1,3 +1,16 @@
+import mmap
+import os
+import re
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from functools import reduce
+from itertools import repeat
+from typing import NamedTuple
+
+from utilities.parallel import get_byte_ranges, get_worker_count
+from utilities.tokenizer import Instruction, Token, Tokenizer
+
+
 def day_03a():
     total = 0
     with open("inputs/input_03.txt") as f:
@@ -97,6 +110,211 @@ def day_03b():
     return total
 
 
+MUL_PATTERN = re.compile(rb"mul\((\d+),(\d+)\)")
+DO = b"do()"
+DONT = b"don't()"
+TOKENIZER = Tokenizer([
+    Instruction("mul", arguments=2),
+    Instruction("do"),
+    Instruction("don't"),
+])
+
+
+@contextmanager
+def open_memory(filepath: str) -> Iterator[bytes | mmap.mmap]:
+    """Open the corrupted memory as a read-only buffer, memory-mapped rather than read in."""
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:  # empty files can't be memory-mapped
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+            yield memory
+
+
+def sum_muls(memory: bytes | mmap.mmap, start: int = 0, end: int | None = None) -> int:
+    """Sum the products of all `mul` instructions between `start` and `end` in the memory."""
+    end = len(memory) if end is None else end
+    return sum(int(num1) * int(num2) for num1, num2 in MUL_PATTERN.findall(memory, start, end))
+
+
+def day_03a_v2(filepath: str = "inputs/input_03.txt") -> int:
+    """Scan the whole memory for `mul` instructions with a single compiled regex, instead of character by character.
+
+    The original `day_03a` above is kept as a reference implementation.
+
+    """
+    with open_memory(filepath) as memory:
+        return sum_muls(memory)
+
+
+def day_03b_v2(filepath: str = "inputs/input_03.txt") -> int:
+    """Jump between `don't()` and `do()` with `find`, only scanning for `mul` instructions while they're enabled.
+
+    Instructions can't overlap (none contains the first letter of another after its own start),
+    so scanning each enabled section separately finds the same instructions as scanning the whole memory.
+    Unlike the original `day_03b`, this doesn't skip the character after an incomplete `do` (e.g. in `domul(2,3)`).
+
+    """
+    total = 0
+    with open_memory(filepath) as memory:
+        enabled_from = 0
+        while True:
+            disabled_from = memory.find(DONT, enabled_from)
+            if disabled_from == -1:
+                total += sum_muls(memory, enabled_from)
+                break
+            total += sum_muls(memory, enabled_from, disabled_from)
+
+            enabled_from = memory.find(DO, disabled_from + len(DONT))
+            if enabled_from == -1:
+                break
+            enabled_from += len(DO)
+
+    return total
+
+
+class MemorySummary(NamedTuple):
+    """Summary of the instructions in a chunk of memory, which can be combined with the following chunk's summary.
+
+    As the chunk's result depends on whether `mul` is enabled at its start, the summary keeps the result
+    under both starting states, along with the state at its end (`None` if it has no `do()` or `don't()`).
+    Combining summaries is associative, so chunks can be summarised independently and then combined in order.
+
+    """
+    total: int  # sum of all `mul` instructions, regardless of state
+    total_if_enabled: int  # sum of enabled `mul` instructions, if enabled at the start
+    total_if_disabled: int  # sum of enabled `mul` instructions, if disabled at the start
+    end_state: bool | None  # whether enabled at the end, or None to keep the starting state
+
+    def get_end_state(self, start_state: bool) -> bool:
+        return start_state if self.end_state is None else self.end_state
+
+    def __add__(self, other: "MemorySummary") -> "MemorySummary":
+        """Combine with the summary of the chunk that follows this one."""
+        if not isinstance(other, MemorySummary):
+            return NotImplemented
+
+        other_total = {True: other.total_if_enabled, False: other.total_if_disabled}
+        return MemorySummary(
+            self.total + other.total,
+            self.total_if_enabled + other_total[self.get_end_state(True)],
+            self.total_if_disabled + other_total[self.get_end_state(False)],
+            self.end_state if other.end_state is None else other.end_state,
+        )
+
+
+def interpret(tokens: Iterable[Token]) -> MemorySummary:
+    """Run the instructions in order, summarising the result under both possible starting states."""
+    total = 0
+    total_before_toggle = 0  # enabled `mul` total before the first `do()` or `don't()`, if enabled at the start
+    total_after_toggle = 0  # enabled `mul` total from the first `do()` or `don't()`, which fixes the state
+    state = None
+
+    for token in tokens:
+        match token:
+            case Token(name="mul", arguments=(num1, num2)):
+                product = num1 * num2
+                total += product
+                if state is None:
+                    total_before_toggle += product
+                elif state:
+                    total_after_toggle += product
+            case Token(name="do"):
+                state = True
+            case Token(name="don't"):
+                state = False
+
+    return MemorySummary(total, total_before_toggle + total_after_toggle, total_after_toggle, state)
+
+
+def interpret_matches(matches: Iterable[re.Match]) -> MemorySummary:
+    """Run the instructions matched by `TOKENIZER` in order, summarising the result as `interpret` does.
+
+    Rather than building a `Token` per instruction, `mul` is told apart by its argument groups,
+    which are the only groups in the pattern, and `do()` from `don't()` by the matched bytes.
+
+    """
+    total = 0
+    total_before_toggle = 0
+    total_after_toggle = 0
+    state = None
+
+    for match in matches:
+        num1, num2 = match.groups()
+        if num1 is not None:
+            product = int(num1) * int(num2)
+            total += product
+            if state is None:
+                total_before_toggle += product
+            elif state:
+                total_after_toggle += product
+        else:
+            state = match[0] == DO
+
+    return MemorySummary(total, total_before_toggle + total_after_toggle, total_after_toggle, state)
+
+
+def day_03_tokenized(filepath: str = "inputs/input_03.txt") -> tuple[int, int]:
+    """Solve both parts in a single pass, interpreting the instructions found by the tokenizer."""
+    with open_memory(filepath) as memory:
+        summary = interpret_matches(TOKENIZER.iter_matches(memory))
+    return summary.total, summary.total_if_enabled
+
+
+def iter_matches_starting_in(
+    memory: bytes | mmap.mmap, start: int, end: int, tokenizer: Tokenizer = TOKENIZER
+) -> Iterator[re.Match]:
+    """Find all instructions starting between `start` and `end`, including one running on past `end`.
+
+    Instructions are first found entirely within the range. Any instruction running past `end` must start
+    after the final instruction found, so each first letter of an instruction from there is tried in turn,
+    matching without a limit to find it however long its arguments are. Scanning the whole memory would
+    find the first of these that matches, so that's the one kept.
+
+    """
+    last_end = start
+    for match in tokenizer.iter_matches(memory, start, end):
+        yield match
+        last_end = match.end()
+
+    for candidate in tokenizer.start_byte_pattern.finditer(memory, last_end, end):
+        if match := tokenizer.pattern.match(memory, candidate.start()):
+            yield match
+            return
+
+
+def iter_tokens_starting_in(
+    memory: bytes | mmap.mmap, start: int, end: int, tokenizer: Tokenizer = TOKENIZER
+) -> Iterator[Token]:
+    """Find all instructions starting between `start` and `end` as tokens (see `iter_matches_starting_in`)."""
+    return map(tokenizer.to_token, iter_matches_starting_in(memory, start, end, tokenizer))
+
+
+def summarise_memory_chunk(filepath: str, start: int, end: int) -> MemorySummary:
+    """Summarise the instructions starting in the given byte range of the memory."""
+    with open_memory(filepath) as memory:
+        return interpret_matches(iter_matches_starting_in(memory, start, end))
+
+
+def day_03_parallel(
+    filepath: str = "inputs/input_03.txt", no_chunks: int | None = None, max_workers: int | None = None
+) -> tuple[int, int]:
+    """Solve both parts by summarising chunks of the memory in separate processes and combining the summaries."""
+    from concurrent.futures import ProcessPoolExecutor  # imported lazily as only needed for the parallel solution
+
+    workers = get_worker_count(max_workers)
+    ranges = get_byte_ranges(os.path.getsize(filepath), no_chunks or workers)
+    if not ranges:
+        return 0, 0
+
+    starts, ends = zip(*ranges)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        summaries = executor.map(summarise_memory_chunk, repeat(filepath), starts, ends)
+        summary = reduce(MemorySummary.__add__, summaries)
+
+    return summary.total, summary.total_if_enabled
+
+
 if __name__ == "__main__":
     answer_03a = day_03a()
     print(answer_03a)
@@ -1,9 +1,22 @@
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+from utilities.word_search import count_words
+
+
 def get_day_04_input() -> list[str]:
     with open("inputs/input_04.txt") as f:
         contents = f.readlines()
     return [c.strip() for c in contents]
 
 
+def iter_day_04_input() -> Iterator[str]:
+    """Lazily read the rows of the grid, one line at a time."""
+    with open("inputs/input_04.txt") as f:
+        for line in f:
+            yield line.strip()
+
+
 def get_vertical_lines(horizontal_lines: list[str]) -> list[str]:
     return ["".join(x) for x in zip(*horizontal_lines)]
 
@@ -93,9 +106,116 @@ def day_04b(horizontal_lines: list[str]) -> int:
     return total
 
 
+def day_04a_v2(horizontal_lines: list[str]) -> int:
+    return count_words(horizontal_lines, ["XMAS"])["XMAS"]
+
+
+type RowMasks = dict[str, int]
+
+
+def get_row_masks(row: str, letters: Iterable[str]) -> RowMasks:
+    """Get a mask per letter flagging where it appears in the row, as an integer with a byte per column.
+
+    The byte for each column is 1 where the letter appears and 0 otherwise, with the first column in the
+    highest byte, so whole rows can be compared with bitwise operations on the integers.
+
+    """
+    row_bytes = row.encode("ascii")
+    return {
+        letter: int.from_bytes(row_bytes.translate(bytes(int(b == ord(letter)) for b in range(256))), "big")
+        for letter in letters
+    }
+
+
+def shift_to_column(mask: int, offset: int) -> int:
+    """Shift a row mask so the byte for column `c + offset` moves to column `c`."""
+    return mask << (8 * offset) if offset >= 0 else mask >> (-8 * offset)
+
+
+def count_words_in_row(row_masks: RowMasks, word: str) -> int:
+    """Count the occurrences of the word running along the row, including overlapping ones."""
+    matches = -1  # all bits set
+    for i, letter in enumerate(word):
+        matches &= shift_to_column(row_masks[letter], i)
+    return matches.bit_count()
+
+
+def count_words_ending_in_window(window: deque[RowMasks], word: str) -> int:
+    """Count the vertical and diagonal occurrences of the word running down the rows in the window.
+
+    The window holds exactly one row per letter of the word, so each occurrence is counted
+    only when the row with its bottom letter arrives.
+
+    """
+    total = 0
+    for col_step in (0, 1, -1):  # down, down-right, down-left
+        matches = -1  # all bits set
+        for i, (letter, row_masks) in enumerate(zip(word, window)):
+            matches &= shift_to_column(row_masks[letter], i * col_step)
+        total += matches.bit_count()
+    return total
+
+
+def day_04a_streaming(rows: Iterable[str], word: str = "XMAS") -> int:
+    """Search the grid for the word one row at a time, keeping only the last `len(word)` rows as masks.
+
+    Horizontal occurrences are counted in each row as it arrives. Vertical and diagonal occurrences
+    are counted when the row with their bottom letter arrives, searching downwards for the word
+    forwards and reversed to cover the upward directions too. All directions are searched with the same masks,
+    so overlapping occurrences (e.g. of "AA" in "AAA") are counted in every direction.
+
+    """
+    words = [word, word[::-1]]
+    window: deque[RowMasks] = deque(maxlen=len(word))
+
+    total = 0
+    for row in rows:
+        row_masks = get_row_masks(row, set(word))
+        total += sum(count_words_in_row(row_masks, w) for w in words)
+        window.append(row_masks)
+        if len(window) == len(word):
+            total += sum(count_words_ending_in_window(window, w) for w in words)
+    return total
+
+
+X_MAS = ["M.S", ".A.", "M.S"]  # one of the X-MAS shapes, with the others found by rotating it
+
+
+def day_04b_v2(horizontal_lines: list[str]) -> int:
+    from utilities.stencil import Stencil, count_stencil_matches, to_letter_array  # imported lazily as needs NumPy
+
+    stencils = Stencil(X_MAS).variants(reflections=False)
+    return count_stencil_matches(to_letter_array(horizontal_lines), stencils)
+
+
+def day_04b_streaming(rows: Iterable[str]) -> int:
+    """Count X-MAS shapes one row at a time, keeping only the last three rows as masks."""
+    window: deque[RowMasks] = deque(maxlen=3)
+
+    total = 0
+    for row in rows:
+        window.append(get_row_masks(row, "AMS"))
+        if len(window) < 3:
+            continue
+
+        top, middle, bottom = window
+        centres = middle["A"]
+        for top_offset, bottom_offset in ((-1, 1), (1, -1)):  # the two diagonals through each centre
+            centres &= (
+                shift_to_column(top["M"], top_offset) & shift_to_column(bottom["S"], bottom_offset)
+                | shift_to_column(top["S"], top_offset) & shift_to_column(bottom["M"], bottom_offset)
+            )
+        total += centres.bit_count()
+    return total
+
+
 if __name__ == "__main__":
     day_04_input = get_day_04_input()
     answer_04a = day_04a(day_04_input)
     print(answer_04a)
+    answer_04a_v2 = day_04a_v2(day_04_input)
+    print(answer_04a_v2)
     answer_04b = day_04b(day_04_input)
     print(answer_04b)
+    answer_04b_v2 = day_04b_v2(day_04_input)
+    print(answer_04b_v2)
@@ -1,18 +1,27 @@
-from collections import defaultdict
+from collections import Counter, defaultdict
+from collections.abc import Container, Iterable, Iterator
 from dataclasses import dataclass
 from functools import total_ordering
+from itertools import chain, takewhile
+
+from utilities.parsing import read_int_lines, stream_int_lines
 
 
 def get_day_05_input() -> tuple[list[tuple[int, int]], list[list[int]]]:
-    with open("inputs/input_05.txt") as f:
-        contents = f.read().splitlines()
+    lines = read_int_lines("inputs/input_05.txt")
+
+    empty_line_no = next(i for i, line in enumerate(lines) if not line)
+    ordering_rules = [(a, b) for a, b in lines[:empty_line_no]]
+    updates = [pages.tolist() for pages in lines[empty_line_no + 1:]]
+    return ordering_rules, updates
+
 
-    empty_line_no = contents.index("")
-    ordering_rules_as_str = [c.split("|") for c in contents[:empty_line_no]]
-    updates_as_str = [c.split(",") for c in contents[empty_line_no + 1:]]
+def iter_day_05_input() -> tuple[list[tuple[int, int]], Iterator[list[int]]]:
+    """Read the ordering rules, and lazily read the updates that follow them one line at a time."""
+    lines = stream_int_lines("inputs/input_05.txt")
 
-    ordering_rules = [(int(a), int(b)) for a, b in ordering_rules_as_str]
-    updates = [[int(x) for x in pages] for pages in updates_as_str]
+    ordering_rules = [(a, b) for a, b in takewhile(len, lines)]  # also consumes the empty line after the rules
+    updates = (pages.tolist() for pages in lines)
     return ordering_rules, updates
 
 
@@ -25,16 +34,69 @@ def is_update_valid(update: list[int], pages_must_occur_after_it: defaultdict[in
         return True
 
 
-def day_05a(ordering_rules: list[tuple[int, int]], updates: list[list[int]]) -> int:
+def day_05a(ordering_rules: list[tuple[int, int]], updates: Iterable[list[int]]) -> int:
     pages_must_occur_after_it = defaultdict(set)
     for a, b in ordering_rules:
         pages_must_occur_after_it[a].add(b)
 
-    valid_updates = [update for update in updates if is_update_valid(update, pages_must_occur_after_it)]
+    valid_updates = (update for update in updates if is_update_valid(update, pages_must_occur_after_it))
     middle_page_sum = sum(update[len(update) // 2] for update in valid_updates)
     return middle_page_sum
 
 
+def is_update_valid_v2(update: list[int], pages_must_occur_after_it: defaultdict[int, set[int]]) -> bool:
+    """Check the update keeping one growing set of the pages seen so far, rather than copying sets for every page.
+
+    `isdisjoint` loops over the smaller of the two sets, so each page costs the fewer of its rules and the pages before it.
+
+    """
+    pages_before_it = set()
+    for page in update:
+        if not pages_before_it.isdisjoint(pages_must_occur_after_it.get(page, ())):
+            return False
+        pages_before_it.add(page)
+    return True
+
+
+def get_later_page_bitsets(ordering_rules: list[tuple[int, int]]) -> tuple[dict[int, int], dict[int, int]]:
+    """Get a bit for each page in the rules, and a bitset per page of the pages that must occur after it.
+
+    Pages are given consecutive bits (rather than using the page number) to keep the bitsets small.
+
+    """
+    page_bits = {}
+    later_page_bitsets = defaultdict(int)
+    for a, b in ordering_rules:
+        for page in (a, b):
+            if page not in page_bits:
+                page_bits[page] = 1 << len(page_bits)
+        later_page_bitsets[a] |= page_bits[b]
+    return page_bits, later_page_bitsets
+
+
+def is_update_valid_bitsets(update: list[int], page_bits: dict[int, int], later_page_bitsets: dict[int, int]) -> bool:
+    """Check the update by keeping a bitset of the pages seen so far, which none of the later pages can be in."""
+    pages_before_it = 0
+    for page in update:
+        if later_page_bitsets.get(page, 0) & pages_before_it:
+            return False
+        pages_before_it |= page_bits.get(page, 0)
+    return True
+
+
+def day_05a_v2(ordering_rules: list[tuple[int, int]], updates: Iterable[list[int]], use_bitsets: bool = False) -> int:
+    if use_bitsets:
+        page_bits, later_page_bitsets = get_later_page_bitsets(ordering_rules)
+        valid_updates = (update for update in updates if is_update_valid_bitsets(update, page_bits, later_page_bitsets))
+    else:
+        pages_must_occur_after_it = defaultdict(set)
+        for a, b in ordering_rules:
+            pages_must_occur_after_it[a].add(b)
+        valid_updates = (update for update in updates if is_update_valid_v2(update, pages_must_occur_after_it))
+
+    return sum(update[len(update) // 2] for update in valid_updates)
+
+
 @total_ordering
 @dataclass
 class Page:
@@ -51,26 +113,232 @@ class Page:
         return self.page_no in other.pages_must_occur_after_it
 
 
-def day_05b(ordering_rules: list[tuple[int, int]], updates: list[list[int]]) -> int:
+def day_05b(ordering_rules: list[tuple[int, int]], updates: Iterable[list[int]]) -> int:
     pages_must_occur_after_it = defaultdict(set)
     for a, b in ordering_rules:
         pages_must_occur_after_it[a].add(b)
 
-    invalid_updates = [update for update in updates if not is_update_valid(update, pages_must_occur_after_it)]
+    invalid_updates = (update for update in updates if not is_update_valid(update, pages_must_occur_after_it))
 
-    corrected_updates = []
+    middle_page_sum = 0  # sum as we go rather than keeping the corrected updates, so updates can be streamed
     for update in invalid_updates:
         pages = [Page(page_no, set(pages_must_occur_after_it[page_no])) for page_no in update]
         corrected_update = [page.page_no for page in sorted(pages)]  # work happens in the sorted() call
-        corrected_updates.append(corrected_update)
+        middle_page_sum += corrected_update[len(corrected_update) // 2]
+
+    return middle_page_sum
+
+
+def get_page_subgraph(update: list[int], pages_must_occur_after_it: defaultdict[int, set[int]]) -> dict[int, set[int]]:
+    """Restrict the rules to the pages in the update, as a map of each page to the pages that must occur after it."""
+    pages = set(update)
+    return {page: pages & pages_must_occur_after_it.get(page, set()) for page in update}
+
+
+def get_in_degrees(subgraph: dict[int, set[int]]) -> dict[int, int]:
+    """Count the pages that must occur before each page."""
+    in_degrees = Counter(chain.from_iterable(subgraph.values()))
+    return {page: in_degrees[page] for page in subgraph}
+
+
+def sort_pages(subgraph: dict[int, set[int]]) -> list[int]:
+    """Sort the pages with Kahn's algorithm, which is only well-defined if the rules give exactly one order.
+
+    Raises ValueError if the rules have a cycle, or leave the order of some pages ambiguous
+    (i.e. more than one page could come next at some point).
+
+    """
+    in_degrees = get_in_degrees(subgraph)
+    ready = [page for page, in_degree in in_degrees.items() if in_degree == 0]
+    order = []
+    while ready:
+        if len(ready) > 1:
+            raise ValueError(f"Ambiguous ordering of pages: {sorted(ready)}")
+        page = ready.pop()
+        order.append(page)
+        for later_page in subgraph[page]:
+            in_degrees[later_page] -= 1
+            if in_degrees[later_page] == 0:
+                ready.append(later_page)
+
+    if len(order) < len(subgraph):
+        raise ValueError(f"Cycle in rules between pages: {sorted(set(subgraph) - set(order))}")
+    return order
 
-    middle_page_sum = sum(update[len(update) // 2] for update in corrected_updates)
+
+def iter_reversed_rules(pages_must_occur_after_it: defaultdict[int, set[int]]) -> Iterator[tuple[int, int]]:
+    """Find the pairs of pages with rules in both directions (once per pair), and any page with a rule to itself."""
+    for a, later_pages in pages_must_occur_after_it.items():
+        for b in later_pages:
+            if a == b or (a < b and a in pages_must_occur_after_it.get(b, ())):
+                yield a, b
+
+
+def get_pages_in_reversed_rules(pages_must_occur_after_it: defaultdict[int, set[int]]) -> set[int]:
+    return set(chain.from_iterable(iter_reversed_rules(pages_must_occur_after_it)))
+
+
+def get_corrected_middle_page(update: list[int], pages_must_occur_after_it: defaultdict[int, set[int]]) -> int:
+    """Get the middle page of the update once correctly ordered, without sorting it if possible.
+
+    If there's a rule for every pair of pages, the number of pages that must occur after each page gives its position,
+    so the middle page can be picked out directly. Distinct counts alone don't rule out cycles, so this also needs
+    every rule to go from a page with more later pages to one with fewer. Otherwise, fall back to a full sort.
+
+    """
+    subgraph = get_page_subgraph(update, pages_must_occur_after_it)
+    pages_by_rank = {len(later_pages): page for page, later_pages in subgraph.items()}
+    if len(pages_by_rank) == len(update) and all(  # counts are 0 to n - 1, so each page's position is known
+        len(subgraph[later_page]) < len(later_pages) for later_pages in subgraph.values() for later_page in later_pages
+    ):
+        return pages_by_rank[len(update) - 1 - len(update) // 2]
+    return sort_pages(subgraph)[len(update) // 2]
+
+
+def get_middle_page_by_rank(
+    update: list[int],
+    page_bits: dict[int, int],
+    later_page_bitsets: dict[int, int],
+    pages_in_reversed_rules: Container[int],
+) -> int | None:
+    """Get the middle page of the corrected update from the bitsets, or None if that needs the rules checking in full.
+
+    Each page's number of later pages in the update is counted with a bitwise AND. With counts 0 to n - 1
+    and no pair of pages with rules both ways, there's exactly one rule per pair, so the rules can't form a cycle
+    and the counts give the order, with no need to check the rules one by one as `get_corrected_middle_page` does.
+
+    """
+    if any(page in pages_in_reversed_rules for page in update):
+        return None
+    update_bitset = 0
+    for page in update:
+        update_bitset |= page_bits.get(page, 0)
+    pages_by_rank = {(later_page_bitsets.get(page, 0) & update_bitset).bit_count(): page for page in update}
+    if len(pages_by_rank) < len(update):
+        return None
+    return pages_by_rank[len(update) - 1 - len(update) // 2]
+
+
+def day_05b_v2(ordering_rules: list[tuple[int, int]], updates: Iterable[list[int]]) -> int:
+    pages_must_occur_after_it = defaultdict(set)
+    for a, b in ordering_rules:
+        pages_must_occur_after_it[a].add(b)
+
+    page_bits, later_page_bitsets = get_later_page_bitsets(ordering_rules)
+    pages_in_reversed_rules = get_pages_in_reversed_rules(pages_must_occur_after_it)
+
+    middle_page_sum = 0
+    for update in updates:
+        if is_update_valid_v2(update, pages_must_occur_after_it):
+            continue
+        middle_page = get_middle_page_by_rank(update, page_bits, later_page_bitsets, pages_in_reversed_rules)
+        if middle_page is None:
+            middle_page = get_corrected_middle_page(update, pages_must_occur_after_it)
+        middle_page_sum += middle_page
     return middle_page_sum
 
 
+class RuleStore:
+    """Ordering rules and the updates they apply to, keeping the middle page sums up to date as the rules change.
+
+    An index of the updates containing each page gives the updates containing both pages of a rule
+    (by intersecting two sets), so a rule change only rechecks the updates it can affect.
+
+    """
+    def __init__(self, ordering_rules: Iterable[tuple[int, int]], updates: Iterable[list[int]]):
+        self.pages_must_occur_after_it: defaultdict[int, set[int]] = defaultdict(set)
+        for a, b in ordering_rules:
+            self.pages_must_occur_after_it[a].add(b)
+        self.page_bits, self.later_page_bitsets = get_later_page_bitsets(
+            [(a, b) for a, later_pages in self.pages_must_occur_after_it.items() for b in later_pages]
+        )
+        # how many pairs of pages with rules both ways each page is in, as only updates with those need checking in full
+        self.pages_in_reversed_rules: Counter[int] = Counter(
+            chain.from_iterable(iter_reversed_rules(self.pages_must_occur_after_it))
+        )
+
+        self.updates: list[list[int]] = [list(update) for update in updates]
+        self.updates_with_page: defaultdict[int, set[int]] = defaultdict(set)
+        for update_no, update in enumerate(self.updates):
+            for page in update:
+                self.updates_with_page[page].add(update_no)
+
+        self.middle_pages: dict[int, int] = {}  # update number to middle page, for valid updates
+        self.corrected_middle_pages: dict[int, int] = {}  # update number to corrected middle page, for invalid updates
+        self.uncorrectable_updates: set[int] = set()  # invalid updates the rules don't give exactly one order for
+        self.valid_middle_page_sum = 0
+        self.corrected_middle_page_sum = 0
+        for update_no in range(len(self.updates)):
+            self._check_update(update_no)
+
+    def get_updates_with_pages(self, a: int, b: int) -> set[int]:
+        """Get the numbers of the updates containing both pages."""
+        return self.updates_with_page.get(a, set()) & self.updates_with_page.get(b, set())
+
+    def add_rule(self, a: int, b: int) -> None:
+        """Add a rule that page `a` must occur before page `b`."""
+        if b not in self.pages_must_occur_after_it[a]:
+            self.pages_must_occur_after_it[a].add(b)
+            for page in (a, b):
+                if page not in self.page_bits:
+                    self.page_bits[page] = 1 << len(self.page_bits)
+            self.later_page_bitsets[a] |= self.page_bits[b]
+            if a == b or a in self.pages_must_occur_after_it.get(b, ()):
+                self._count_reversed_rule(a, b, 1)
+            self._recheck_updates(a, b)
+
+    def remove_rule(self, a: int, b: int) -> None:
+        """Remove the rule that page `a` must occur before page `b`, if there is one."""
+        if b in self.pages_must_occur_after_it.get(a, ()):
+            if a == b or a in self.pages_must_occur_after_it.get(b, ()):
+                self._count_reversed_rule(a, b, -1)
+            self.pages_must_occur_after_it[a].remove(b)
+            self.later_page_bitsets[a] &= ~self.page_bits[b]
+            self._recheck_updates(a, b)
+
+    def _count_reversed_rule(self, a: int, b: int, change: int) -> None:
+        for page in (a, b):
+            self.pages_in_reversed_rules[page] += change
+            if not self.pages_in_reversed_rules[page]:
+                del self.pages_in_reversed_rules[page]
+
+    def _recheck_updates(self, a: int, b: int) -> None:
+        for update_no in self.get_updates_with_pages(a, b):
+            self._forget_update(update_no)
+            self._check_update(update_no)
+
+    def _forget_update(self, update_no: int) -> None:
+        self.valid_middle_page_sum -= self.middle_pages.pop(update_no, 0)
+        self.corrected_middle_page_sum -= self.corrected_middle_pages.pop(update_no, 0)
+        self.uncorrectable_updates.discard(update_no)
+
+    def _check_update(self, update_no: int) -> None:
+        update = self.updates[update_no]
+        if is_update_valid_v2(update, self.pages_must_occur_after_it):
+            self.middle_pages[update_no] = update[len(update) // 2]
+            self.valid_middle_page_sum += self.middle_pages[update_no]
+            return
+
+        middle_page = get_middle_page_by_rank(
+            update, self.page_bits, self.later_page_bitsets, self.pages_in_reversed_rules
+        )
+        if middle_page is None:
+            try:
+                middle_page = get_corrected_middle_page(update, self.pages_must_occur_after_it)
+            except ValueError:
+                self.uncorrectable_updates.add(update_no)
+                return
+        self.corrected_middle_pages[update_no] = middle_page
+        self.corrected_middle_page_sum += middle_page
+
+
 if __name__ == "__main__":
     ordering_rules, updates = get_day_05_input()
     answer_05a = day_05a(ordering_rules, updates)
     print(answer_05a)
+    answer_05a_v2 = day_05a_v2(ordering_rules, updates)
+    print(answer_05a_v2)
     answer_05b = day_05b(ordering_rules, updates)
     print(answer_05b)
+    answer_05b_v2 = day_05b_v2(ordering_rules, updates)
+    print(answer_05b_v2)
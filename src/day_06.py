@@ -1,14 +1,9 @@
+from collections.abc import Callable
 from itertools import cycle
 
+from utilities.inputs import get_day_06_input
 
-def get_day_06_input() -> tuple[list[list[str]], tuple[int, int]]:
-    with open("inputs/input_06.txt") as f:
-        contents = f.read().splitlines()
-
-    (start_row,) = [i for i, row in enumerate(contents) if "^" in row]
-    grid = [list(row) for row in contents]
-    start_col = grid[start_row].index("^")
-    return grid, (start_row, start_col)
+type ProgressCallback = Callable[[int, int], None]  # called with the number of steps reached and the total
 
 
 DIRECTIONS = [(-1, 0), (0, 1), (1, 0), (0, -1)]
@@ -77,13 +72,19 @@ def does_grid_have_cycle(grid: list[list[str]], start_pos: tuple[int, int]) -> b
             return True
 
 
-def day_06b(grid: list[list[str]], start_pos: tuple[int, int]) -> int:
+def print_row_progress(row_no: int, no_rows: int) -> None:
+    print(f"Row {row_no:>3} of {no_rows}")
+
+
+def day_06b(
+    grid: list[list[str]], start_pos: tuple[int, int], progress: ProgressCallback = print_row_progress
+) -> int:
     length = len(grid[0])
     height = len(grid)
 
     potential_obstructions = []
     for i in range(length):
-        print(f"Row {i + 1:>3} of {length}")
+        progress(i + 1, length)
         for j in range(height):
             if grid[i][j] not in ("#", "^"):
                 grid_copy = [row[:] for row in grid]
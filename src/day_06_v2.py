@@ -0,0 +1,269 @@
+"""Guard simulation for day 6 that jumps from turn to turn, rather than stepping one cell at a time.
+
+The obstacles in each row and column are kept in sorted lists, so the next obstacle ahead of the guard
+is found by bisection, and the cost of a walk depends on the number of turns rather than the length of the path.
+For part b, only cells on the guard's original path are tried as obstructions, each resuming the walk from
+just before the guard first reaches it, and adding the obstruction to the sorted lists rather than copying the map.
+These checks are independent, so can also be split between processes.
+
+The guard's state at each turn is packed into one integer, `(cell index << 2) | direction`, so loop checks
+can mark states in a flat array (reused between checks), or use Brent's algorithm in constant memory.
+"""
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Callable, Iterable, Iterator
+from typing import NamedTuple, Self
+
+from utilities.grid import Coordinates
+from utilities.inputs import get_day_06_input
+from utilities.parallel import CHUNKS_PER_WORKER, get_worker_count
+
+UP, RIGHT, DOWN, LEFT = range(4)  # clockwise, so turning right adds one
+DIRECTIONS = [(-1, 0), (0, 1), (1, 0), (0, -1)]  # row and column steps for each direction (as in `day_06`)
+
+type ProgressCallback = Callable[[int, int], None]  # called with the number of steps reached and the total
+type Candidate = tuple[Coordinates, Coordinates, int]  # obstruction, and the position and direction to resume from
+
+
+class Segment(NamedTuple):
+    """A straight stretch of the guard's walk, between two positions (inclusive) in one direction."""
+    start: Coordinates
+    end: Coordinates
+    direction: int
+    leaves_map: bool  # whether the guard walks off the map after reaching `end`, rather than turning
+
+
+class GuardMap:
+    """Map of obstacles, kept as the sorted obstacle columns in each row and obstacle rows in each column."""
+    def __init__(self, height: int, width: int, obstacles: Iterable[Coordinates]):
+        self.height: int = height
+        self.width: int = width
+        self.obstacle_cols_by_row: list[list[int]] = [[] for __ in range(height)]
+        self.obstacle_rows_by_col: list[list[int]] = [[] for __ in range(width)]
+        for row, col in sorted(obstacles):  # so both sets of lists are filled in order
+            self.obstacle_cols_by_row[row].append(col)
+            self.obstacle_rows_by_col[col].append(row)
+
+        # the last check each state was seen in, so the array needn't be cleared between checks
+        # (allocated on the first check that needs it, so isn't paid for in low memory mode)
+        self._seen_states: bytearray | None = None
+        self._check_no: int = 0
+
+    @classmethod
+    def from_grid(cls, grid: list[list[str]]) -> Self:
+        obstacles = [(row, col) for row, items in enumerate(grid) for col, item in enumerate(items) if item == "#"]
+        return cls(len(grid), len(grid[0]), obstacles)
+
+    def add_obstacle(self, position: Coordinates) -> None:
+        row, col = position
+        insort(self.obstacle_cols_by_row[row], col)
+        insort(self.obstacle_rows_by_col[col], row)
+
+    def remove_obstacle(self, position: Coordinates) -> None:
+        row, col = position
+        self.obstacle_cols_by_row[row].remove(col)
+        self.obstacle_rows_by_col[col].remove(row)
+
+    def get_next_stop(self, position: Coordinates, direction: int) -> tuple[Coordinates, bool]:
+        """Get where the guard stops walking from the position, and whether that's because they reach the edge.
+
+        The guard stops just before the next obstacle in the given direction, or at the edge of the map if there isn't one.
+
+        """
+        row, col = position
+        if direction == UP:
+            rows = self.obstacle_rows_by_col[col]
+            i = bisect_left(rows, row)
+            return ((rows[i - 1] + 1, col), False) if i else ((0, col), True)
+        elif direction == RIGHT:
+            cols = self.obstacle_cols_by_row[row]
+            i = bisect_right(cols, col)
+            return ((row, cols[i] - 1), False) if i < len(cols) else ((row, self.width - 1), True)
+        elif direction == DOWN:
+            rows = self.obstacle_rows_by_col[col]
+            i = bisect_right(rows, row)
+            return ((rows[i] - 1, col), False) if i < len(rows) else ((self.height - 1, col), True)
+        elif direction == LEFT:
+            cols = self.obstacle_cols_by_row[row]
+            i = bisect_left(cols, col)
+            return ((row, cols[i - 1] + 1), False) if i else ((row, 0), True)
+        raise ValueError(f"Invalid direction: {direction}")
+
+    def iter_segments(self, start: Coordinates, direction: int = UP) -> Iterator[Segment]:
+        """Walk the guard from the start, one straight segment at a time, until they leave the map.
+
+        If the guard is stuck in a loop, this never ends.
+
+        """
+        position = start
+        while True:
+            end, leaves_map = self.get_next_stop(position, direction)
+            yield Segment(position, end, direction, leaves_map)
+            if leaves_map:
+                return
+            position, direction = end, (direction + 1) % 4
+
+    def to_state(self, position: Coordinates, direction: int) -> int:
+        row, col = position
+        return ((row * self.width + col) << 2) | direction
+
+    def get_next_state(self, state: int) -> int | None:
+        """Get the guard's state at their next turn (facing the new direction), or None if they leave the map."""
+        (row, col), leaves_map = self.get_next_stop(divmod(state >> 2, self.width), state & 3)
+        if leaves_map:
+            return None
+        return ((row * self.width + col) << 2) | ((state + 1) & 3)
+
+    def has_loop(self, start: Coordinates, direction: int = UP, low_memory: bool = False) -> bool:
+        """Check whether the guard gets stuck in a loop, i.e. reaches the same state twice.
+
+        By default, each state reached is marked with the number of this check, so the array needs clearing
+        only when the (byte-sized) check number wraps around. With `low_memory`, Brent's algorithm is used instead.
+
+        """
+        state = self.to_state(start, direction)
+        if low_memory:
+            return self._has_loop_brent(state)
+
+        self._check_no += 1
+        if self._seen_states is None:
+            self._seen_states = bytearray(self.height * self.width * 4)
+        elif self._check_no == 256:
+            self._seen_states[:] = bytes(len(self._seen_states))
+            self._check_no = 1
+
+        seen_states, check_no = self._seen_states, self._check_no
+        while state is not None:
+            if seen_states[state] == check_no:
+                return True
+            seen_states[state] = check_no
+            state = self.get_next_state(state)
+        return False
+
+    def _has_loop_brent(self, state: int) -> bool:
+        """Check for a loop with Brent's algorithm, keeping only two states.
+
+        The hare moves on one state at a time, while the tortoise waits at the start of ever-doubling stretches
+        of the walk, so the hare meets it once both are in a loop shorter than the stretch.
+
+        """
+        tortoise, hare = state, self.get_next_state(state)
+        power = steps = 1
+        while hare != tortoise:
+            if hare is None:
+                return False
+            if steps == power:
+                tortoise, power, steps = hare, power * 2, 0
+            hare = self.get_next_state(hare)
+            steps += 1
+        return True
+
+    def get_visited_cells(self, start: Coordinates, direction: int = UP) -> bytearray:
+        """Flag the cells the guard visits, in a flat array with one byte per cell, filling each segment with one slice."""
+        width = self.width
+        visited = bytearray(self.height * width)
+        for (start_row, start_col), (end_row, end_col), __, __ in self.iter_segments(start, direction):
+            first, last = sorted((start_row * width + start_col, end_row * width + end_col))
+            step = 1 if start_row == end_row else width
+            visited[first:last + 1:step] = b"\x01" * ((last - first) // step + 1)
+        return visited
+
+
+def day_06a_v2(grid: list[list[str]], start_pos: tuple[int, int]) -> int:
+    return GuardMap.from_grid(grid).get_visited_cells(start_pos).count(1)
+
+
+def iter_first_visits(guard_map: GuardMap, start: Coordinates, direction: int = UP) -> Iterator[Candidate]:
+    """Walk the guard's path, yielding each cell (other than the start) the first time the guard reaches it.
+
+    Each cell comes with the position and direction the guard reaches it from,
+    which is where the guard would turn instead if the cell were obstructed.
+
+    """
+    width = guard_map.width
+    visited = bytearray(guard_map.height * width)
+    visited[start[0] * width + start[1]] = 1
+    for (row, col), end, direction, __ in guard_map.iter_segments(start, direction):
+        row_step, col_step = DIRECTIONS[direction]
+        while (row, col) != end:
+            next_row, next_col = row + row_step, col + col_step
+            if not visited[next_row * width + next_col]:
+                visited[next_row * width + next_col] = 1
+                yield (next_row, next_col), (row, col), direction
+            row, col = next_row, next_col
+
+
+def count_candidate_loops(guard_map: GuardMap, candidates: Iterable[Candidate], low_memory: bool = False) -> int:
+    """Count the candidate obstructions that leave the guard stuck in a loop, resuming the walk from each candidate."""
+    no_obstructions = 0
+    for obstruction, position, direction in candidates:
+        guard_map.add_obstacle(obstruction)
+        no_obstructions += guard_map.has_loop(position, direction, low_memory)
+        guard_map.remove_obstacle(obstruction)
+    return no_obstructions
+
+
+def count_loop_obstructions(
+    guard_map: GuardMap, start: Coordinates, direction: int = UP, low_memory: bool = False
+) -> int:
+    """Count the cells where adding an obstruction would leave the guard stuck in a loop.
+
+    An obstruction off the guard's path changes nothing, so only cells on the path are tried. The walk up to
+    the guard's first visit to the cell is unchanged, so each check resumes from there, facing the obstruction.
+
+    """
+    return count_candidate_loops(guard_map, list(iter_first_visits(guard_map, start, direction)), low_memory)
+
+
+def day_06b_v2(grid: list[list[str]], start_pos: tuple[int, int], low_memory: bool = False) -> int:
+    return count_loop_obstructions(GuardMap.from_grid(grid), start_pos, low_memory=low_memory)
+
+
+_worker_guard_map: GuardMap | None = None  # base map for each worker process, set by `init_worker`
+
+
+def init_worker(guard_map: GuardMap) -> None:
+    """Keep the base map in the worker process, so it's sent once per worker rather than with every chunk."""
+    global _worker_guard_map
+    _worker_guard_map = guard_map
+
+
+def count_candidate_loops_in_worker(candidates: list[Candidate]) -> int:
+    return count_candidate_loops(_worker_guard_map, candidates)
+
+
+def day_06b_parallel(
+    grid: list[list[str]],
+    start_pos: tuple[int, int],
+    max_workers: int | None = None,
+    progress: ProgressCallback | None = None,
+) -> int:
+    """Count the loop obstructions by splitting the candidates between processes.
+
+    The chunks take every nth candidate, so each gets a similar mix of short and long resumed walks.
+    `progress` is called with the number of chunks finished and the total as each chunk finishes.
+
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed  # imported lazily as only needed here
+
+    guard_map = GuardMap.from_grid(grid)
+    candidates = list(iter_first_visits(guard_map, start_pos))
+    workers = get_worker_count(max_workers)
+    no_chunks = min(workers * CHUNKS_PER_WORKER, len(candidates))
+    chunks = [candidates[i::no_chunks] for i in range(no_chunks)]
+
+    no_obstructions = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(guard_map,)) as executor:
+        futures = [executor.submit(count_candidate_loops_in_worker, chunk) for chunk in chunks]
+        for chunks_done, future in enumerate(as_completed(futures), 1):
+            no_obstructions += future.result()
+            if progress is not None:
+                progress(chunks_done, no_chunks)
+    return no_obstructions
+
+
+if __name__ == "__main__":
+    grid, start_pos = get_day_06_input()
+    answer_06a_v2 = day_06a_v2(grid, start_pos)
+    print(answer_06a_v2)
+    answer_06b_v2 = day_06b_v2(grid, start_pos)
+    print(answer_06b_v2)
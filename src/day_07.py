@@ -1,23 +1,37 @@
+import heapq
 import itertools
 import operator
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import repeat
+from typing import NamedTuple
 
+from utilities.operators import ADD, CONCATENATE, MULTIPLY, Operator, concatenate
+from utilities.parallel import CHUNKS_PER_WORKER, get_worker_count
+from utilities.parsing import read_int_lines, stream_int_lines
 
-def get_day_07_input() -> list[tuple[int, list[int]]]:
-    with open("inputs/input_07.txt") as f:
-        contents = f.read().splitlines()
 
-    calibration_equations_as_str = [c.split(":") for c in contents]
-    calibration_equations = [(int(a), [int(x) for x in b.strip().split(" ")]) for a, b in calibration_equations_as_str]
+def get_day_07_input() -> list[tuple[int, list[int]]]:
+    lines = read_int_lines("inputs/input_07.txt", as_lists=True)  # as test values can be too big for 64 bits
+    calibration_equations = [(line[0], line[1:]) for line in lines]
     return calibration_equations
 
 
+def iter_day_07_input() -> Iterator[tuple[int, list[int]]]:
+    """Lazily read the calibration equations, one line at a time."""
+    for line in stream_int_lines("inputs/input_07.txt", as_lists=True):
+        yield line[0], line[1:]
+
+
 OPERATORS = (operator.add, operator.mul)
-concat_int = lambda a, b: int(str(a) + str(b))
+concat_int = concatenate  # arithmetic rather than via strings
 OPERATORS_WITH_CONCAT = (operator.add, operator.mul, concat_int)
 
 
-def day_07a(calibration_equations: list[tuple[int, list[int]]]) -> int:
-    valid_equations = []
+def day_07a(calibration_equations: Iterable[tuple[int, list[int]]]) -> int:
+    total = 0  # sum as we go rather than keeping the valid equations, so equations can be streamed
     for equation in calibration_equations:
         test_value, nums = equation
         for comb in itertools.product(OPERATORS, repeat=len(nums) - 1):
@@ -28,14 +42,14 @@ def day_07a(calibration_equations: list[tuple[int, list[int]]]) -> int:
                     break  # overshot so break and try next operator combination
             else:  # used up all numbers and didn't overshoot
                 if result == test_value:
-                    valid_equations.append(equation)
+                    total += test_value
                     break  # found a solution for this equation so skip any un-tried combinations and move to next equation
 
-    return sum(test_value for test_value, nums in valid_equations)
+    return total
 
 
-def day_07b(calibration_equations: list[tuple[int, list[int]]]) -> int:
-    valid_equations = []
+def day_07b(calibration_equations: Iterable[tuple[int, list[int]]]) -> int:
+    total = 0  # sum as we go rather than keeping the valid equations, so equations can be streamed
     for equation in calibration_equations:
         test_value, nums = equation
         for comb in itertools.product(OPERATORS_WITH_CONCAT, repeat=len(nums) - 1):
@@ -46,15 +60,232 @@ def day_07b(calibration_equations: list[tuple[int, list[int]]]) -> int:
                     break  # overshot so break and try next operator combination
             else:  # used up all numbers and didn't overshoot
                 if result == test_value:
-                    valid_equations.append(equation)
+                    total += test_value
                     break  # found a solution for this equation so skip any un-tried combinations and move to next equation
 
-    return sum(test_value for test_value, nums in valid_equations)
+    return total
+
+
+DEADLINE_CHECK_INTERVAL = 4096  # states to try between checks of the time, as each check isn't free
+
+
+def can_be_made_true(
+    test_value: int, nums: list[int], operators: Sequence[Operator] = (ADD, MULTIPLY), deadline: float | None = None
+) -> bool:
+    """Check whether the equation can be made true, working backwards from the test value.
+
+    Each number from the end is taken off the value by undoing an operator, which for most operators only works
+    for a few values (e.g. multiples of the number for multiplication), so most branches die immediately.
+    If all the operators are monotonic, no value can be negative, so branches going negative are dropped too.
+    The states (value and numbers left) already tried are remembered, as different branches can meet again.
+
+    If a deadline (in `time.monotonic()` terms) is given, it's checked every few thousand states,
+    raising TimeoutError once passed.
+
+    """
+    all_monotonic = all(op.monotonic for op in operators)
+    to_try = [(test_value, len(nums) - 1)]
+    tried = set()
+    while to_try:
+        state = to_try.pop()
+        if state in tried:
+            continue
+        tried.add(state)
+        if deadline is not None and len(tried) % DEADLINE_CHECK_INTERVAL == 0 and time.monotonic() > deadline:
+            raise TimeoutError(f"Gave up on equation with test value {test_value}")
+
+        value, i = state
+        n = nums[i]
+        if i == 0:
+            if value == n:
+                return True
+            continue
+
+        for op in operators:
+            if n == op.annihilator:
+                if value == op.forward(0, n):
+                    return True  # the numbers before don't affect the result, so any operators for them will do
+                continue
+            left_value = op.inverse(value, n)
+            if left_value is not None and (left_value >= 0 or not all_monotonic):
+                to_try.append((left_value, i - 1))
+
+    return False
+
+
+def to_sorted_array(values: Iterable[int], bound: int | None = None) -> Sequence[int]:
+    """Sort the values (up to the bound) into a compact array of 64-bit integers, or a list if any are too big for that."""
+    sorted_values = sorted(values)
+    if bound is not None:
+        del sorted_values[bisect_right(sorted_values, bound):]
+    try:
+        return array("q", sorted_values)
+    except OverflowError:
+        return sorted_values
+
+
+def get_reachable_values(
+    values: Sequence[int], n: int, operators: Sequence[Operator], bound: int | None = None
+) -> Sequence[int]:
+    """Get the values reachable by applying any of the operators to any of the values and the number.
+
+    Values over the bound are dropped, which is only valid if the operators are monotonic. Annihilators
+    (e.g. multiplying by zero) give their result whatever came before, even if every value before was dropped.
+
+    """
+    reachable = set()
+    for op in operators:
+        if n == op.annihilator:
+            reachable.add(op.forward(0, n))
+        else:
+            reachable.update(map(op.forward, values, repeat(n)))
+    return to_sorted_array(reachable, bound)
+
+
+class PrefixTrie:
+    """Trie of the equations' numbers, so equations starting with the same numbers share the work for them."""
+    def __init__(self):
+        self.children: dict[int, PrefixTrie] = {}
+        self.test_values: list[int] = []  # test values of the equations whose numbers end here
+        self.max_test_value: int | None = None  # of all the equations passing through here
+
+    def add(self, test_value: int, nums: list[int]) -> None:
+        node = self
+        for n in nums:
+            node = node.children.setdefault(n, PrefixTrie())
+            node.max_test_value = test_value if node.max_test_value is None else max(node.max_test_value, test_value)
+        node.test_values.append(test_value)
+
+
+def sum_true_equations_by_dp(
+    calibration_equations: Iterable[tuple[int, list[int]]], operators: Sequence[Operator]
+) -> int:
+    """Sum the test values of the true equations, by finding every value reachable from each shared prefix.
+
+    The reachable values after each number are worked out once per node of the prefix trie, and (if the operators
+    are monotonic) capped at the largest test value of the equations below that node.
+
+    """
+    trie = PrefixTrie()
+    for test_value, nums in calibration_equations:
+        trie.add(test_value, nums)
+    all_monotonic = all(op.monotonic for op in operators)
+
+    total = 0
+    to_visit = [(child, n, None) for n, child in trie.children.items()]
+    while to_visit:
+        node, n, values = to_visit.pop()
+        bound = node.max_test_value if all_monotonic else None
+        if values is None:  # first number
+            reachable = to_sorted_array([n], bound)
+        else:
+            reachable = get_reachable_values(values, n, operators, bound)
+
+        for test_value in node.test_values:
+            i = bisect_left(reachable, test_value)
+            if i < len(reachable) and reachable[i] == test_value:
+                total += test_value
+        to_visit.extend((child, child_n, reachable) for child_n, child in node.children.items())
+
+    return total
+
+
+def sum_true_equations(
+    calibration_equations: Iterable[tuple[int, list[int]]], operators: Sequence[Operator], use_dp: bool = False
+) -> int:
+    if use_dp:
+        return sum_true_equations_by_dp(calibration_equations, operators)
+    return sum(test_value for test_value, nums in calibration_equations if can_be_made_true(test_value, nums, operators))
+
+
+class BatchResult(NamedTuple):
+    total: int  # sum of the test values of the equations found to be true
+    timed_out: list[tuple[int, list[int]]]  # equations given up on, which may or may not be true
+
+
+def estimate_cost(nums: list[int], operators: Sequence[Operator]) -> int:
+    """Estimate the cost of checking an equation by its number of operator combinations."""
+    return len(operators) ** (len(nums) - 1)
+
+
+def get_balanced_chunks(
+    calibration_equations: Iterable[tuple[int, list[int]]], operators: Sequence[Operator], no_chunks: int
+) -> list[list[tuple[int, list[int]]]]:
+    """Split the equations into chunks of similar total estimated cost.
+
+    Each equation, most costly first, goes to the chunk with the lowest total so far.
+
+    """
+    chunks = [[] for __ in range(no_chunks)]
+    chunk_costs = [(0, i) for i in range(no_chunks)]  # heap of each chunk's total cost
+    costed_equations = [(estimate_cost(nums, operators), test_value, nums) for test_value, nums in calibration_equations]
+    for cost, test_value, nums in sorted(costed_equations, key=lambda equation: equation[0], reverse=True):
+        chunk_cost, i = heapq.heappop(chunk_costs)
+        chunks[i].append((test_value, nums))
+        heapq.heappush(chunk_costs, (chunk_cost + cost, i))
+    return [chunk for chunk in chunks if chunk]
+
+
+def evaluate_chunk(
+    calibration_equations: list[tuple[int, list[int]]], operators: Sequence[Operator], time_limit: float | None
+) -> BatchResult:
+    """Check each equation, giving up on any that take longer than the time limit (in seconds)."""
+    total = 0
+    timed_out = []
+    for test_value, nums in calibration_equations:
+        deadline = None if time_limit is None else time.monotonic() + time_limit
+        try:
+            if can_be_made_true(test_value, nums, operators, deadline):
+                total += test_value
+        except TimeoutError:
+            timed_out.append((test_value, nums))
+    return BatchResult(total, timed_out)
+
+
+def sum_true_equations_parallel(
+    calibration_equations: Iterable[tuple[int, list[int]]],
+    operators: Sequence[Operator],
+    max_workers: int | None = None,
+    time_limit: float | None = 1.0,
+) -> BatchResult:
+    """Sum the test values of the true equations, checking chunks of similar cost in separate processes.
+
+    Each equation gets `time_limit` seconds, so one pathological equation can't hold up the rest,
+    and any given up on are returned for reporting (or retrying another way) rather than counted.
+    Chunk results are added up as they finish.
+
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed  # imported lazily as only needed here
+
+    workers = get_worker_count(max_workers)
+    chunks = get_balanced_chunks(calibration_equations, operators, workers * CHUNKS_PER_WORKER)
+
+    total = 0
+    timed_out = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(evaluate_chunk, chunk, operators, time_limit) for chunk in chunks]
+        for future in as_completed(futures):
+            result = future.result()
+            total += result.total
+            timed_out += result.timed_out
+    return BatchResult(total, timed_out)
+
+
+def day_07a_v2(calibration_equations: Iterable[tuple[int, list[int]]], use_dp: bool = False) -> int:
+    return sum_true_equations(calibration_equations, (ADD, MULTIPLY), use_dp)
+
+
+def day_07b_v2(calibration_equations: Iterable[tuple[int, list[int]]], use_dp: bool = False) -> int:
+    return sum_true_equations(calibration_equations, (ADD, MULTIPLY, CONCATENATE), use_dp)
 
 
 if __name__ == "__main__":
     day_07_input = get_day_07_input()
     answer_07a = day_07a(day_07_input)
     print(answer_07a)
+    answer_07a_v2 = day_07a_v2(day_07_input)
+    print(answer_07a_v2)
     answer_07b = day_07b(day_07_input)
     print(answer_07b)
+    answer_07b_v2 = day_07b_v2(day_07_input)
+    print(answer_07b_v2)
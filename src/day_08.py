@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from math import gcd
 from typing import Union
 
+from utilities.inputs import get_day_08_input
+
 
 @dataclass
 class Location:
@@ -84,13 +86,6 @@ class Vector:
 
 
 
-def get_day_08_input() -> list[str]:
-    with open("inputs/input_08.txt") as f:
-        contents = f.read().splitlines()
-
-    return contents
-
-
 def get_locations_by_frequency(map: list[str]) -> dict[str, list[Location]]:
     locations_by_frequency = defaultdict(list)
     
@@ -0,0 +1,158 @@
+"""Solution to day 8 using lightweight coordinate types, with antinodes stored as packed integers.
+
+`Location` and `Vector` are frozen dataclasses with slots, so are immutable and have no per-instance `__dict__`,
+while supporting the same operators as the dataclasses in `day_08`.
+The antinodes for each pair of antennae are worked out from plain integer coordinates, rather than
+creating a `Location` and `Vector` per antinode, and stored as `row * length + col`,
+so a line of antinodes with harmonics is just a `range`.
+"""
+import itertools
+from collections import defaultdict
+from dataclasses import dataclass
+from math import gcd
+from typing import Union
+
+from utilities.inputs import get_day_08_input
+
+
+@dataclass(frozen=True, slots=True)
+class Location:
+    """A position on the map, specified by row and column (see `day_08.Location`)."""
+    row: int
+    col: int
+
+    def __add__(self, other: "Vector") -> "Location":
+        if isinstance(other, Vector):
+            return Location(self.row + other.row, self.col + other.col)
+        else:
+            return NotImplemented
+
+    def __sub__(self, other: "Location") -> "Vector":
+        if isinstance(other, Location):
+            return Vector(self.row - other.row, self.col - other.col)
+        else:
+            return NotImplemented
+
+    def is_on_map(self, length: int, height: int) -> bool:
+        return 0 <= self.row < height and 0 <= self.col < length
+
+    def pack(self, length: int) -> int:
+        """Pack into a single integer, unique among the positions on a map of the given length."""
+        return self.row * length + self.col
+
+
+@dataclass(frozen=True, slots=True)
+class Vector:
+    """A directional vector, specified by row and column (see `day_08.Vector`)."""
+    row: int
+    col: int
+
+    def __add__(self, other: Union["Vector", "Location"]) -> Union["Vector", "Location"]:
+        if isinstance(other, Vector):
+            return Vector(self.row + other.row, self.col + other.col)
+        elif isinstance(other, Location):
+            return Location(self.row + other.row, self.col + other.col)
+        else:
+            return NotImplemented
+
+    def __sub__(self, other: "Vector") -> "Vector":
+        if isinstance(other, Vector):
+            return Vector(self.row - other.row, self.col - other.col)
+        else:
+            return NotImplemented
+
+    def __mul__(self, other: int) -> "Vector":
+        if isinstance(other, int):
+            return Vector(self.row * other, self.col * other)
+        else:
+            return NotImplemented
+
+    def __floordiv__(self, other: int) -> "Vector":
+        if isinstance(other, int):
+            row_quotient, row_remainder = divmod(self.row, other)
+            if row_remainder != 0:
+                raise ValueError("Divisor must be factor of row coordinate")
+            col_quotient, col_remainder = divmod(self.col, other)
+            if col_remainder != 0:
+                raise ValueError("Divisor must be factor of column coordinate")
+            return Vector(row_quotient, col_quotient)
+        else:
+            return NotImplemented
+
+    def __neg__(self) -> "Vector":
+        return Vector(-self.row, -self.col)
+
+
+def get_locations_by_frequency(map: list[str]) -> dict[str, list[Location]]:
+    locations_by_frequency = defaultdict(list)
+    for i, line in enumerate(map):
+        for j, item in enumerate(line):
+            if item != ".":
+                locations_by_frequency[item].append(Location(i, j))
+    return dict(locations_by_frequency)
+
+
+def day_08a_v2(map: list[str]) -> int:
+    length = len(map[0])
+    height = len(map)
+
+    antinodes = set()
+    for locations in get_locations_by_frequency(map).values():
+        coordinates = [(location.row, location.col) for location in locations]
+        for (row_a, col_a), (row_b, col_b) in itertools.combinations(coordinates, 2):
+            row_step, col_step = row_b - row_a, col_b - col_a
+            for row, col in ((row_b + row_step, col_b + col_step), (row_a - row_step, col_a - col_step)):
+                if 0 <= row < height and 0 <= col < length:
+                    antinodes.add(row * length + col)
+    return len(antinodes)
+
+
+def get_possible_steps(row: int, col: int, row_step: int, col_step: int, length: int, height: int) -> int:
+    """Work out how many steps of `(row_step, col_step)` we can take from `(row, col)` while remaining on the grid.
+
+    Unlike `day_08.get_possible_steps`, either coordinate of the step can be zero (but not both).
+
+    """
+    steps = max(length, height)
+    if row_step:
+        steps = row // -row_step if row_step < 0 else (height - 1 - row) // row_step
+    if col_step:
+        steps = min(steps, col // -col_step if col_step < 0 else (length - 1 - col) // col_step)
+    return steps
+
+
+def get_antinode_range(antenna_1: Location, antenna_2: Location, length: int, height: int) -> range:
+    """Get antinodes for a pair of antennae, taking resonant harmonics into account, as a range of packed positions."""
+    row, col = antenna_1.row, antenna_1.col
+    row_step, col_step = antenna_2.row - row, antenna_2.col - col
+    divisor = gcd(row_step, col_step)
+    row_step, col_step = row_step // divisor, col_step // divisor
+
+    low = get_possible_steps(row, col, -row_step, -col_step, length, height)
+    high = get_possible_steps(row, col, row_step, col_step, length, height)
+
+    start = row * length + col
+    step = row_step * length + col_step
+    first, last = start - low * step, start + high * step
+    if step < 0:
+        first, last, step = last, first, -step
+    return range(first, last + 1, step)
+
+
+def day_08b_v2(map: list[str]) -> int:
+    length = len(map[0])
+    height = len(map)
+
+    antinodes = set()
+    for locations in get_locations_by_frequency(map).values():
+        for a, b in itertools.combinations(locations, 2):
+            antinodes.update(get_antinode_range(a, b, length, height))
+    return len(antinodes)
+
+
+if __name__ == "__main__":
+    day_08_input = get_day_08_input()
+    answer_08a_v2 = day_08a_v2(day_08_input)
+    print(answer_08a_v2)
+    answer_08b_v2 = day_08b_v2(day_08_input)
+    print(answer_08b_v2)
@@ -1,11 +1,6 @@
 from collections import deque
 
-
-def get_day_09_input() -> str:
-    with open("inputs/input_09.txt") as f:
-        contents = f.read()
-
-    return contents
+from utilities.inputs import get_day_09_input
 
 
 def create_disk_layout(disk_map: str) -> list[bool]:
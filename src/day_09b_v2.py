@@ -1,4 +1,5 @@
-from day_09 import get_day_09_input
+from utilities.inputs import get_day_09_input
+
 
 class MemoryUnit:
     """A contiguous piece of memory in the filesystem.
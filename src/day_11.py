@@ -1,12 +1,11 @@
 import time
 from functools import lru_cache
 
+from utilities.parsing import read_ints
 
-def get_day_11_input() -> list[int]:
-    with open("inputs/input_11.txt") as f:
-        contents = f.read()
 
-    stones = [int(x) for x in contents.split(" ")]
+def get_day_11_input() -> list[int]:
+    stones = read_ints("inputs/input_11.txt").tolist()
     return stones
 
 
@@ -3,16 +3,10 @@ from enum import Enum
 from typing import Callable
 
 from utilities.grid import Cell, Coordinates, Grid, STRAIGHT_VECTORS
+from utilities.inputs import get_day_12_input
 from utilities.timer import timer
 
 
-def get_day_12_input() -> list[str]:
-    with open("inputs/input_12.txt") as f:
-        contents = f.read().splitlines()
-
-    return contents
-
-
 class Side(Enum):
     UNKNOWN = 0
     CONNECTED = 1
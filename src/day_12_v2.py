@@ -1,7 +1,7 @@
 from typing import Iterable
 
-from day_12 import get_day_12_input
 from utilities.grid import Cell, Coordinates, Grid
+from utilities.inputs import get_day_12_input
 from utilities.timer import timer
 
 
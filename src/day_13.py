@@ -1,8 +1,7 @@
 from enum import Enum
 from math import lcm
 
-from parse import parse
-
+from utilities.parsing import iter_records, read_ints
 from utilities.timer import timer
 
 
@@ -17,20 +16,9 @@ type MachineConfiguration = tuple[tuple[int, int], tuple[int, int], tuple[int, i
 
 
 def get_day_13_input() -> list[MachineConfiguration]:
-    with open("inputs/input_13.txt") as f:
-        contents = f.read().splitlines()
-    contents.append("")
-
-    machines = []
-    i = 0
-    while i < len(contents):
-        a = parse("Button A: X+{:d}, Y+{:d}", contents[i])
-        b = parse("Button B: X+{:d}, Y+{:d}", contents[i + 1])
-        prize = parse("Prize: X={:d}, Y={:d}", contents[i + 2])
-        assert contents[i + 3] == ""
-        machines.append(((a[0], a[1]), (b[0], b[1]), (prize[0], prize[1])))
-        i += 4
-    
+    values = read_ints("inputs/input_13.txt", fields=6)  # button A X/Y, button B X/Y, prize X/Y
+
+    machines = [((ax, ay), (bx, by), (px, py)) for ax, ay, bx, by, px, py in iter_records(values, 6)]
     return machines
 
 
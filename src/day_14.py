@@ -1,7 +1,6 @@
 from math import prod
 
-from parse import parse
-
+from utilities.parsing import iter_records, read_ints
 from utilities.timer import timer
 
 type Vector = tuple[int, int]
@@ -9,11 +8,9 @@ type Robot = tuple[Vector, Vector]
 
 def get_day_14_input() -> tuple[list[Robot], Vector]:
     dimensions = (101, 103)
-    with open("inputs/input_14.txt") as f:
-        contents = f.read().splitlines()
+    values = read_ints("inputs/input_14.txt", fields=4)  # position X/Y, velocity X/Y
 
-    parsed = [parse("p={:d},{:d} v={:d},{:d}", line) for line in contents]
-    robots = [((px, py), (vx, vy)) for px, py, vx, vy in parsed]
+    robots = [((px, py), (vx, vy)) for px, py, vx, vy in iter_records(values, 4)]
     return robots, dimensions
 
 
@@ -0,0 +1,38 @@
+"""Run the solutions for a batch of days, reporting how long each module takes to import.
+
+Usage (from the `src` directory): python run.py 01 09b_v2 12_v2
+
+Each argument is the suffix of a `day_*` module, which is imported (timing the import)
+and then run as if it were the main script.
+"""
+import importlib
+import runpy
+import sys
+import time
+
+
+def import_day(day: str) -> float:
+    """Import the module for the given day and return how long the import took, in seconds."""
+    start_time = time.perf_counter()
+    importlib.import_module(f"day_{day}")
+    end_time = time.perf_counter()
+    return end_time - start_time
+
+
+def run_day(day: str) -> None:
+    """Run the module for the given day as the main script."""
+    runpy.run_module(f"day_{day}", run_name="__main__")
+
+
+def run_days(days: list[str]) -> None:
+    import_times = {day: import_day(day) for day in days}
+    for day, import_time in import_times.items():
+        print(f"Imported in {import_time:.4f} secs: day_{day}")
+    print(f"Imported in {sum(import_times.values()):.4f} secs: all modules")
+
+    for day in days:
+        run_day(day)
+
+
+if __name__ == "__main__":
+    run_days(sys.argv[1:])
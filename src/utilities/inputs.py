@@ -0,0 +1,36 @@
+"""Loaders for puzzle inputs that are shared between modules.
+
+This module deliberately has no imports, so alternative solutions can load their input
+without importing the original solution module and everything it depends on.
+"""
+
+
+def get_day_06_input() -> tuple[list[list[str]], tuple[int, int]]:
+    with open("inputs/input_06.txt") as f:
+        contents = f.read().splitlines()
+
+    (start_row,) = [i for i, row in enumerate(contents) if "^" in row]
+    grid = [list(row) for row in contents]
+    start_col = grid[start_row].index("^")
+    return grid, (start_row, start_col)
+
+
+def get_day_08_input() -> list[str]:
+    with open("inputs/input_08.txt") as f:
+        contents = f.read().splitlines()
+
+    return contents
+
+
+def get_day_09_input() -> str:
+    with open("inputs/input_09.txt") as f:
+        contents = f.read()
+
+    return contents
+
+
+def get_day_12_input() -> list[str]:
+    with open("inputs/input_12.txt") as f:
+        contents = f.read().splitlines()
+
+    return contents
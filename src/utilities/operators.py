@@ -0,0 +1,68 @@
+"""Binary operators for combining whole numbers, each with an inverse for working back from a result.
+
+An operator's inverse takes a result and the right operand, and gives the left operand, or None if no
+left operand gives that result. Inverses rule out most candidates cheaply (e.g. multiplication needs an exact
+division), which is what lets a solver search backwards from a target rather than trying every combination.
+The functions are all defined at module level (not lambdas), so operators can be sent to worker processes.
+"""
+import operator
+from bisect import bisect_right
+from collections.abc import Callable
+from typing import NamedTuple
+
+POWERS_OF_TEN = [10 ** i for i in range(1, 40)]
+CONCAT_POWERS = [10 ** len(str(n)) for n in range(10_000)]  # direct lookup for the small numbers most common in inputs
+
+
+class Operator(NamedTuple):
+    """A binary operator, with its inverse and some properties a solver can use to prune its search."""
+    name: str
+    forward: Callable[[int, int], int]
+    inverse: Callable[[int, int], int | None]  # from the result and right operand, get the left operand (if any)
+    monotonic: bool = True  # whether the result is never less than the left operand, for non-negative operands
+    annihilator: int | None = None  # right operand for which the result doesn't depend on the left operand
+
+
+def get_concat_power(n: int) -> int:
+    """Get the power of ten to shift a number by before adding `n`, to append the digits of `n` to it."""
+    if 0 <= n < len(CONCAT_POWERS):
+        return CONCAT_POWERS[n]
+    if n < POWERS_OF_TEN[-1]:
+        return POWERS_OF_TEN[bisect_right(POWERS_OF_TEN, n)]
+    return 10 ** len(str(n))
+
+
+def concatenate(a: int, b: int) -> int:
+    if 0 <= b < len(CONCAT_POWERS):
+        return a * CONCAT_POWERS[b] + b
+    return a * get_concat_power(b) + b
+
+
+def unconcatenate(result: int, b: int) -> int | None:
+    power = get_concat_power(b)
+    return result // power if result % power == b else None
+
+
+def divide_exactly(result: int, b: int) -> int | None:
+    return result // b if result % b == 0 else None
+
+
+def get_exact_root(value: int, n: int) -> int | None:
+    """Get the non-negative whole number whose nth power is the value, if there is one."""
+    if value < 0:
+        return None
+    low, high = 0, 1 << (value.bit_length() // n + 1)
+    while low < high:
+        mid = (low + high) // 2
+        if mid ** n < value:
+            low = mid + 1
+        else:
+            high = mid
+    return low if low ** n == value else None
+
+
+ADD = Operator("+", operator.add, operator.sub)
+MULTIPLY = Operator("*", operator.mul, divide_exactly, annihilator=0)
+CONCATENATE = Operator("||", concatenate, unconcatenate)
+SUBTRACT = Operator("-", operator.sub, operator.add, monotonic=False)
+POWER = Operator("**", operator.pow, get_exact_root, annihilator=0)
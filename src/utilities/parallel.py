@@ -0,0 +1,47 @@
+"""Functions for splitting puzzle inputs into chunks that can be processed in parallel.
+
+Chunks are described by byte ranges, so only the file path and offsets need sending to worker processes,
+which then read their own chunk of the file.
+"""
+import os
+
+CHUNKS_PER_WORKER = 4  # more chunks than workers evens out the load if some chunks are slower
+
+
+def get_byte_ranges(size: int, no_chunks: int) -> list[tuple[int, int]]:
+    """Split `size` bytes into `no_chunks` roughly equal byte ranges `(start, end)`, ignoring line boundaries."""
+    boundaries = [size * i // no_chunks for i in range(no_chunks + 1)]
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if start < end]
+
+
+def get_line_aligned_ranges(filepath: str, no_chunks: int) -> list[tuple[int, int]]:
+    """Split a file into roughly equal byte ranges `(start, end)`, each starting at the beginning of a line.
+
+    Fewer ranges than requested are returned if the file has too few lines to fill them all.
+
+    """
+    size = os.path.getsize(filepath)
+    boundaries = [0]
+    with open(filepath, "rb") as f:
+        for i in range(1, no_chunks):
+            target = max(size * i // no_chunks, boundaries[-1])
+            if target == 0:
+                continue
+            f.seek(target - 1)
+            f.readline()  # move to the start of the first line beginning at or after the target
+            boundaries.append(min(f.tell(), size))
+    boundaries.append(size)
+
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if start < end]
+
+
+def read_range(filepath: str, start: int, end: int) -> bytes:
+    """Read the bytes from `start` up to (but not including) `end`."""
+    with open(filepath, "rb") as f:
+        f.seek(start)
+        return f.read(end - start)
+
+
+def get_worker_count(max_workers: int | None = None) -> int:
+    """Get the number of worker processes to use, defaulting to the number of available CPUs."""
+    return max_workers or os.process_cpu_count() or 1
@@ -0,0 +1,135 @@
+"""Functions for fast extraction of integers from puzzle inputs.
+
+Inputs are read as bytes and scanned with a single compiled regex, rather than splitting lines
+or matching format strings line by line. Integers are collected into flat `array("q")` buffers,
+which can be grouped into fixed-size records or viewed as NumPy arrays without copying.
+"""
+import re
+from array import array
+from collections.abc import Iterable, Iterator  # cheaper to import than typing
+
+INT_PATTERN = re.compile(rb"-?\d+")
+DIGIT_BYTES = b"0123456789"
+NUMBER_BYTES = b"-" + DIGIT_BYTES
+WHITESPACE_BYTES = b" \t\r\n"
+DEFAULT_CHUNK_SIZE = 1 << 24  # 16 MiB
+
+
+def extract_ints(data: bytes) -> array:
+    """Extract all (signed) integers from the given bytes into a flat array."""
+    return array("q", map(int, INT_PATTERN.findall(data)))
+
+
+def read_ints(filepath: str, fields: int = 1) -> array:
+    """Read all integers from a file into a flat array.
+
+    `fields` is the number of integers per record; the total count is checked to be a multiple of it.
+
+    """
+    with open(filepath, "rb") as f:
+        values = extract_ints(f.read())
+    if len(values) % fields != 0:
+        raise ValueError(f"Found {len(values)} integers, which is not a multiple of {fields} fields")
+    return values
+
+
+def read_ints_as_numpy(filepath: str, fields: int = 1):
+    """Read all integers from a file into a NumPy array with one row per record of `fields` integers.
+
+    Files containing nothing but whitespace-separated non-negative integers are parsed directly by NumPy,
+    which is much faster than extracting the integers with the regex. Minus signs are left to the regex,
+    as NumPy reads stray ones differently (e.g. "- 3" as -3), and so are values NumPy clamps to the int64 maximum,
+    so the regex can raise for those too big.
+
+    """
+    import numpy as np  # imported lazily so that NumPy is only needed when it's used
+
+    with open(filepath, "rb") as f:
+        data = f.read()
+    values = None
+    if not data.translate(None, DIGIT_BYTES + WHITESPACE_BYTES):
+        values = np.fromstring(data, dtype=np.int64, sep=" ")  # any whitespace counts as a separator
+        if len(values) and values.max() == np.iinfo(np.int64).max:
+            values = None
+    if values is None:
+        values = np.frombuffer(extract_ints(data), dtype=np.int64)
+    if len(values) % fields != 0:
+        raise ValueError(f"Found {len(values)} integers, which is not a multiple of {fields} fields")
+    return values.reshape(-1, fields)
+
+
+def iter_records(values: array, fields: int) -> Iterator[tuple[int, ...]]:
+    """Group a flat array of integers into tuples of `fields` integers."""
+    return zip(*[iter(values)] * fields)
+
+
+def find_chunk_end(buffer: bytes) -> int:
+    """Find the position after the last byte of the buffer that can't be part of an integer.
+
+    Everything before this position can be parsed without risk of splitting an integer in two.
+
+    """
+    end = len(buffer)
+    while end > 0 and buffer[end - 1] in NUMBER_BYTES:
+        end -= 1
+    return end
+
+
+def iter_int_chunks(filepath: str, fields: int = 1, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[array]:
+    """Read integers from a file in chunks, yielding arrays each containing a whole number of records.
+
+    The file is read `chunk_size` bytes at a time, so memory use is bounded by the chunk size rather than the file size.
+    Bytes at the end of a chunk that could be the start of an integer are carried over to the next chunk,
+    as are any integers left over from an incomplete record.
+
+    """
+    carried_bytes = b""
+    carried_values = array("q")
+    with open(filepath, "rb") as f:
+        while chunk := f.read(chunk_size):
+            buffer = carried_bytes + chunk
+            end = find_chunk_end(buffer)
+            carried_bytes = buffer[end:]
+
+            values = carried_values + extract_ints(buffer[:end])
+            complete = len(values) - len(values) % fields
+            carried_values = values[complete:]
+            if complete:
+                yield values[:complete]
+
+    values = carried_values + extract_ints(carried_bytes)
+    if len(values) % fields != 0:
+        raise ValueError(f"Found {len(values) % fields} integers left over after the final complete record")
+    if values:
+        yield values
+
+
+def iter_int_lines(lines: Iterable[bytes], as_lists: bool = False) -> Iterator[array | list[int]]:
+    """Extract the integers from each line, yielding one array per line (empty for lines without integers).
+
+    With `as_lists`, each line is given as a list of Python ints instead, for integers too big for 64 bits.
+
+    """
+    findall = INT_PATTERN.findall
+    if as_lists:
+        for line in lines:
+            yield list(map(int, findall(line)))
+    else:
+        for line in lines:
+            yield array("q", map(int, findall(line)))
+
+
+def stream_int_lines(filepath: str, as_lists: bool = False) -> Iterator[array | list[int]]:
+    """Lazily read the integers from each line of a file, giving one array (or list) per line.
+
+    Only one line is held in memory at a time; the file is closed once the generator is exhausted.
+
+    """
+    with open(filepath, "rb") as f:
+        yield from iter_int_lines(f, as_lists)
+
+
+def read_int_lines(filepath: str, as_lists: bool = False) -> list[array | list[int]]:
+    """Read the integers from each line of a file, giving one array (or list) per line."""
+    with open(filepath, "rb") as f:
+        return list(iter_int_lines(f.read().splitlines(), as_lists))
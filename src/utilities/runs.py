@@ -0,0 +1,28 @@
+"""Functions for lists summarised as sorted runs of `(value, count)`, i.e. sorted histograms."""
+from collections.abc import Iterable
+
+
+def get_total_distance(runs1: Iterable[tuple[int, int]], runs2: Iterable[tuple[int, int]]) -> int:
+    """Calculate the total distance between two lists, given each list as sorted runs of `(value, count)`.
+
+    Equivalent to pairing up the sorted lists, but walks the runs of equal values instead,
+    so never needs the full lists.
+
+    """
+    runs1 = iter(runs1)
+    runs2 = iter(runs2)
+    value1, count1 = next(runs1, (0, 0))
+    value2, count2 = next(runs2, (0, 0))
+
+    total = 0
+    while count1 and count2:
+        pairs = min(count1, count2)  # number of pairs made before one of the runs is used up
+        total += pairs * abs(value1 - value2)
+        count1 -= pairs
+        count2 -= pairs
+        if not count1:
+            value1, count1 = next(runs1, (0, 0))
+        if not count2:
+            value2, count2 = next(runs2, (0, 0))
+
+    return total
@@ -0,0 +1,89 @@
+"""Matching small 2D templates ("stencils") of letters against a large grid of letters, using NumPy.
+
+A stencil is a small block of letters, where a wildcard letter matches anything. Matching is vectorised:
+for each non-wildcard letter in the stencil, the grid is compared with that letter over a shifted slice,
+and the results are combined with boolean AND, so each letter costs one whole-array operation.
+"""
+from collections.abc import Iterable
+from typing import Self
+
+import numpy as np
+
+WILDCARD = "."
+
+
+class Stencil:
+    """A small rectangular template of letters, with `WILDCARD` marking cells that match any letter."""
+    def __init__(self, rows: Iterable[str]):
+        self.rows: tuple[str, ...] = tuple(rows)
+        if not self.rows or len(set(map(len, self.rows))) != 1 or not self.rows[0]:
+            raise ValueError("Stencil rows must be non-empty and all the same length")
+
+    @property
+    def height(self) -> int:
+        return len(self.rows)
+
+    @property
+    def width(self) -> int:
+        return len(self.rows[0])
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Stencil) and self.rows == other.rows
+
+    def __hash__(self) -> int:
+        return hash(self.rows)
+
+    def __repr__(self) -> str:
+        return f"Stencil({list(self.rows)})"
+
+    def rotate(self) -> Self:
+        """Rotate a quarter turn clockwise."""
+        return Stencil("".join(col) for col in zip(*reversed(self.rows)))
+
+    def reflect(self) -> Self:
+        """Reflect left to right."""
+        return Stencil(row[::-1] for row in self.rows)
+
+    def variants(self, *, rotations: bool = True, reflections: bool = True) -> list[Self]:
+        """Get the distinct variants of the stencil under rotation and/or reflection (including itself)."""
+        variants = [self]
+        if rotations:
+            for __ in range(3):
+                variants.append(variants[-1].rotate())
+        if reflections:
+            variants += [variant.reflect() for variant in variants]
+        return list(dict.fromkeys(variants))  # drop duplicates from symmetric stencils, keeping order
+
+
+def to_letter_array(grid: list[str]) -> np.ndarray:
+    """Convert a grid of (ASCII) letters into a 2D array of bytes."""
+    return np.frombuffer("".join(grid).encode("ascii"), dtype=np.uint8).reshape(len(grid), -1)
+
+
+def match_stencil(letters: np.ndarray, stencil: Stencil) -> np.ndarray:
+    """Find where the stencil matches, as a boolean array flagging the top-left cell of each match."""
+    height, width = letters.shape
+    out_height, out_width = height - stencil.height + 1, width - stencil.width + 1
+    if out_height <= 0 or out_width <= 0:
+        return np.zeros((max(out_height, 0), max(out_width, 0)), dtype=bool)
+
+    matches = np.ones((out_height, out_width), dtype=bool)
+    for i, row in enumerate(stencil.rows):
+        for j, letter in enumerate(row):
+            if letter != WILDCARD:
+                matches &= letters[i:i + out_height, j:j + out_width] == ord(letter)
+    return matches
+
+
+def count_stencil_matches(letters: np.ndarray, stencils: Iterable[Stencil]) -> int:
+    """Count the matches of all the given stencils (a position matching more than one stencil counts more than once)."""
+    return sum(int(match_stencil(letters, stencil).sum()) for stencil in stencils)
+
+
+def locate_stencil_matches(letters: np.ndarray, stencils: Iterable[Stencil]) -> list[tuple[Stencil, int, int]]:
+    """Locate the matches of all the given stencils, as `(stencil, row, col)` of each match's top-left cell."""
+    return [
+        (stencil, int(row), int(col))
+        for stencil in stencils
+        for row, col in zip(*np.nonzero(match_stencil(letters, stencil)))
+    ]
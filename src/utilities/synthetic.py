@@ -0,0 +1,35 @@
+"""Generators of large synthetic puzzle inputs, for benchmarks and tests.
+
+Each generator takes a seed, so the same input can be generated again.
+"""
+import itertools
+import random
+
+
+def get_synthetic_reports(no_reports: int, report_length: int, seed: int = 0) -> list[list[int]]:
+    """Generate long increasing reports, each with one unsafe level inserted at a random position."""
+    rng = random.Random(seed)
+    reports = []
+    for __ in range(no_reports):
+        report = list(itertools.accumulate(rng.choices((1, 2, 3), k=report_length)))
+        report[rng.randrange(report_length)] = 0
+        reports.append(report)
+    return reports
+
+
+def get_synthetic_input(
+    no_pages: int, no_updates: int, update_length: int, seed: int = 0
+) -> tuple[list[tuple[int, int]], list[list[int]]]:
+    """Generate rules putting every pair of pages in a random order, and updates half of which have two pages swapped."""
+    rng = random.Random(seed)
+    order = rng.sample(range(10 * no_pages), no_pages)
+    ordering_rules = [(a, b) for i, a in enumerate(order) for b in order[i + 1:]]
+
+    updates = []
+    for update_no in range(no_updates):
+        update = [order[i] for i in sorted(rng.sample(range(no_pages), update_length))]
+        if update_no % 2:
+            i, j = sorted(rng.sample(range(update_length), 2))
+            update[i], update[j] = update[j], update[i]
+        updates.append(update)
+    return ordering_rules, updates
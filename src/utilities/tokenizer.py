@@ -0,0 +1,89 @@
+"""Tokenizer for simple instruction languages, compiled from a declarative set of instructions.
+
+Each instruction looks like a function call, e.g. `mul(2,4)` or `do()`: a name followed by a bracketed,
+comma-separated list of integer arguments. The whole instruction set is compiled into one combined regex,
+so finding the next instruction costs a single regex search however many instructions there are.
+"""
+import re
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+
+
+class Instruction(NamedTuple):
+    """Definition of an instruction: its name, number of arguments and allowed number of digits per argument."""
+    name: str
+    arguments: int = 0
+    min_digits: int = 1
+    max_digits: int | None = None  # None for no limit
+
+    @property
+    def pattern(self) -> str:
+        max_digits = "" if self.max_digits is None else self.max_digits
+        digits = rf"\d{{{self.min_digits},{max_digits}}}"
+        arguments = ",".join([f"({digits})"] * self.arguments)
+        return rf"{re.escape(self.name)}\({arguments}\)"
+
+
+class Token(NamedTuple):
+    """An instruction found in the input, with its arguments and the positions it starts and ends at."""
+    name: str
+    arguments: tuple[int, ...]
+    start: int
+    end: int
+
+
+class Tokenizer:
+    """Tokenizer finding all instructions from the given set.
+
+    The instruction patterns are combined as plain alternatives, as wrapping each in its own group stops
+    the regex engine skipping ahead to the possible first letters (making the search several times slower).
+    Instead, a match is identified by the name before its opening bracket,
+    and the argument groups for each instruction are numbered on from those of the instructions before it.
+
+    """
+    def __init__(self, instructions: Iterable[Instruction]):
+        self.instructions: list[Instruction] = list(instructions)
+        names = [instruction.name for instruction in self.instructions]
+        if len(set(names)) != len(names):
+            raise ValueError("Instruction names must be unique")
+        if any("(" in name or not name for name in names):
+            raise ValueError("Instruction names must be non-empty and not contain '('")
+
+        self._argument_groups: dict[bytes, tuple[str, range]] = {}  # name to instruction name and argument groups
+        group = 1
+        for instruction in self.instructions:
+            arguments = range(group, group + instruction.arguments)
+            self._argument_groups[instruction.name.encode()] = (instruction.name, arguments)
+            group += instruction.arguments
+
+        combined = "|".join(instruction.pattern for instruction in self.instructions)
+        self.pattern: re.Pattern = re.compile(combined.encode())
+        self.start_byte_pattern: re.Pattern = re.compile(b"[" + re.escape(b"".join(sorted(self.start_bytes))) + b"]")
+
+    @property
+    def start_bytes(self) -> set[bytes]:
+        """The first bytes of all instruction names."""
+        return {instruction.name.encode()[:1] for instruction in self.instructions}
+
+    def to_token(self, match: re.Match) -> Token:
+        name, argument_groups = self._argument_groups[match[0].partition(b"(")[0]]
+        arguments = tuple(int(match[i]) for i in argument_groups)
+        return Token(name, arguments, match.start(), match.end())
+
+    def iter_matches(self, buffer: bytes, start: int = 0, end: int | None = None) -> Iterator[re.Match]:
+        """Find all instructions lying entirely between `start` and `end` in the buffer, as raw regex matches.
+
+        This skips building a `Token` per instruction, for callers that can work from the match groups directly.
+
+        """
+        end = len(buffer) if end is None else end
+        return self.pattern.finditer(buffer, start, end)
+
+    def iter_tokens(self, buffer: bytes, start: int = 0, end: int | None = None) -> Iterator[Token]:
+        """Find all instructions lying entirely between `start` and `end` in the buffer."""
+        return map(self.to_token, self.iter_matches(buffer, start, end))
+
+    def match_token(self, buffer: bytes, position: int) -> Token | None:
+        """Get the instruction starting exactly at the given position, if there is one."""
+        if (match := self.pattern.match(buffer, position)) is not None:
+            return self.to_token(match)
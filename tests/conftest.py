@@ -0,0 +1,12 @@
+import pytest
+
+
+@pytest.fixture
+def write_input(tmp_path, monkeypatch):
+    """Factory writing the contents of a day's input file to `inputs/` in a temporary working directory."""
+    def write(day: int, contents: str) -> None:
+        (tmp_path / "inputs").mkdir(exist_ok=True)
+        (tmp_path / "inputs" / f"input_{day:02}.txt").write_text(contents)
+        monkeypatch.chdir(tmp_path)
+
+    return write
@@ -0,0 +1,20 @@
+from day_01 import day_01_streaming, day_01a, iter_day_01_input
+
+EXAMPLE = """\
+3   4
+4   3
+2   5
+1   3
+3   9
+3   3
+"""
+
+
+def test_day_01a(write_input):
+    write_input(1, EXAMPLE)
+    assert day_01a() == 11
+
+
+def test_day_01_streaming(write_input):
+    write_input(1, EXAMPLE)
+    assert day_01_streaming(iter_day_01_input()) == (11, 31)
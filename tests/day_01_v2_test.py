@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from day_01 import day_01_streaming
+from day_01_v2 import day_01_v2, solve_by_counting, solve_by_sorting
+
+EXAMPLE_LIST_1 = [3, 4, 2, 1, 3, 3]
+EXAMPLE_LIST_2 = [4, 3, 5, 3, 9, 3]
+
+
+def test_day_01_v2():
+    assert day_01_v2(np.array(EXAMPLE_LIST_1), np.array(EXAMPLE_LIST_2)) == (11, 31)
+
+
+@pytest.mark.parametrize("high", [10, 100_000, 10 ** 12])
+def test_engines_match_streaming(high):
+    rng = random.Random(high)
+    list1 = [rng.randint(-high, high) for __ in range(2_000)]
+    list2 = [rng.choice(list1) if rng.random() < 0.5 else rng.randint(-high, high) for __ in range(2_000)]
+    expected = day_01_streaming(zip(list1, list2))
+
+    array1, array2 = np.array(list1), np.array(list2)
+    assert day_01_v2(array1, array2) == expected
+    assert solve_by_sorting(array1, array2) == expected
+    if high <= 100_000:
+        assert solve_by_counting(array1, array2, -high, high) == expected
+
+
+def test_day_01_v2_without_overflow():
+    same = np.full(1_000_000, 10_000_000)
+    assert day_01_v2(same, same) == (0, 10_000_000 * 10 ** 12)
+
+    list1 = [2 ** 62, -2 ** 62, 3, 2 ** 62]
+    list2 = [-2 ** 62, 2 ** 62, 2 ** 62, 5]
+    assert day_01_v2(np.array(list1), np.array(list2)) == day_01_streaming(zip(list1, list2))
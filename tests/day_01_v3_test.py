@@ -0,0 +1,32 @@
+import random
+
+import pytest
+
+from day_01 import day_01_streaming
+from day_01_v3 import day_01_v3
+from utilities.parallel import get_line_aligned_ranges
+
+
+def write_pairs(filepath, pairs):
+    filepath.write_text("".join(f"{a}   {b}\n" for a, b in pairs))
+
+
+@pytest.mark.parametrize("no_chunks", [1, 2, 3, 7, 100])
+def test_get_line_aligned_ranges(tmp_path, no_chunks):
+    filepath = tmp_path / "input.txt"
+    write_pairs(filepath, [(i, i * 10) for i in range(20)])
+    contents = filepath.read_bytes()
+
+    ranges = get_line_aligned_ranges(filepath, no_chunks)
+    assert b"".join(contents[start:end] for start, end in ranges) == contents
+    assert all(start == 0 or contents[start - 1:start] == b"\n" for start, __ in ranges)
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_day_01_v3(tmp_path, max_workers):
+    rng = random.Random(max_workers)
+    pairs = [(rng.randint(1, 50), rng.randint(1, 50)) for __ in range(1_000)]
+    filepath = tmp_path / "input.txt"
+    write_pairs(filepath, pairs)
+
+    assert day_01_v3(filepath, max_workers=max_workers) == day_01_streaming(pairs)
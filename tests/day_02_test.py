@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from day_02 import day_02a, day_02b, day_02b_v2, iter_day_02_input
+
+EXAMPLE = [
+    [7, 6, 4, 2, 1],
+    [1, 2, 7, 8, 9],
+    [9, 7, 6, 2, 1],
+    [1, 3, 2, 4, 5],
+    [8, 6, 4, 4, 1],
+    [1, 3, 6, 7, 9],
+]
+
+
+@pytest.mark.parametrize(["day_02", "solution"], [(day_02a, 2), (day_02b, 4)])
+def test_day_02(day_02, solution):
+    assert day_02(EXAMPLE) == solution
+
+
+@pytest.mark.parametrize(["day_02", "solution"], [(day_02a, 2), (day_02b, 4)])
+def test_day_02_streaming(write_input, day_02, solution):
+    write_input(2, "".join(" ".join(map(str, r)) + "\n" for r in EXAMPLE))
+
+    assert day_02(iter_day_02_input()) == solution
+
+
+def test_day_02b_v2():
+    assert day_02b_v2(EXAMPLE) == 4
+
+
+def random_report(rng: random.Random, length: int) -> list[int]:
+    direction = rng.choice([1, -1])
+    report = [rng.randint(1, 99)]
+    for __ in range(length - 1):
+        step = direction * rng.randint(1, 3) if rng.random() < 0.9 else rng.randint(-5, 5)
+        report.append(report[-1] + step)
+    return report
+
+
+def test_day_02b_v2_matches_day_02b():
+    rng = random.Random(2)
+    reports = [random_report(rng, rng.randint(1, 12)) for __ in range(5_000)]
+    for report in reports:
+        assert day_02b_v2([report]) == day_02b([report]), report
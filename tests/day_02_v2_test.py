@@ -0,0 +1,28 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from day_02 import day_02a, day_02b
+from day_02_test import EXAMPLE, random_report
+from day_02_v2 import day_02a_v2, day_02b_v2, pack_reports
+
+
+def test_pack_reports():
+    levels, lengths = pack_reports([[1, 2, 3], [4], [5, 6]])
+    assert levels.tolist() == [[1, 2, 3], [4, 0, 0], [5, 6, 0]]
+    assert lengths.tolist() == [3, 1, 2]
+
+
+@pytest.mark.parametrize(["day_02_v2", "solution"], [(day_02a_v2, 2), (day_02b_v2, 4)])
+def test_day_02_v2(day_02_v2, solution):
+    assert day_02_v2(*pack_reports(EXAMPLE)) == solution
+
+
+def test_day_02_v2_matches_day_02():
+    rng = random.Random(3)
+    reports = [random_report(rng, rng.randint(1, 12)) for __ in range(5_000)]
+    levels, lengths = pack_reports(reports)
+    assert day_02a_v2(levels, lengths) == day_02a(reports)
+    assert day_02b_v2(levels, lengths) == day_02b(reports)
@@ -0,0 +1,72 @@
+import pytest
+
+from day_03 import (
+    MemorySummary, day_03_parallel, day_03_tokenized, day_03a, day_03a_v2, day_03b, day_03b_v2,
+    iter_tokens_starting_in
+)
+from utilities.tokenizer import Instruction, Token, Tokenizer
+
+EXAMPLE_A = "xmul(2,4)%&mul[3,7]!@^do_not_mul(5,5)+mul(32,64]then(mul(11,8)mul(8,5))"
+EXAMPLE_B = "xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))"
+EXAMPLE_EXTRA = "don't()do()mmul(1,2)mul(3,4)mul(5,don't()mul(6,7)do()do()don't(mul(8,9)don't()don't()mul(10,10)do()!"
+
+
+@pytest.mark.parametrize(["day_03", "contents", "solution"], [
+    (day_03a, EXAMPLE_A, 161),
+    (day_03a_v2, EXAMPLE_A, 161),
+    (day_03b, EXAMPLE_B, 48),
+    (day_03b_v2, EXAMPLE_B, 48),
+    (day_03a_v2, "", 0),
+    (day_03b_v2, "", 0),
+])
+def test_day_03(write_input, day_03, contents, solution):
+    write_input(3, contents)
+    assert day_03() == solution
+
+
+@pytest.mark.parametrize(["day_03", "day_03_v2"], [(day_03a, day_03a_v2), (day_03b, day_03b_v2)])
+def test_day_03_v2_matches_reference(write_input, day_03, day_03_v2):
+    write_input(3, EXAMPLE_EXTRA * 3 + "x")
+    assert day_03_v2() == day_03()
+
+
+@pytest.mark.parametrize("no_chunks", [1, 2, 5, 17, 200])
+def test_day_03_parallel(write_input, no_chunks):
+    contents = EXAMPLE_EXTRA + EXAMPLE_B + "mul(123456789,987654321)" + EXAMPLE_A
+    write_input(3, contents)
+
+    assert day_03_parallel(no_chunks=no_chunks, max_workers=2) == (day_03a_v2(), day_03b_v2())
+
+
+def test_memory_summary_is_associative():
+    summaries = [
+        MemorySummary(1, 1, 0, None), MemorySummary(2, 2, 0, False), MemorySummary(4, 0, 4, True),
+        MemorySummary(8, 8, 0, None), MemorySummary(16, 16, 8, False),
+    ]
+    for split in range(1, len(summaries)):
+        left = sum(summaries[1:split], start=summaries[0])
+        right = sum(summaries[split + 1:], start=summaries[split])
+        assert left + right == sum(summaries[1:], start=summaries[0])
+
+
+@pytest.mark.parametrize("contents", [EXAMPLE_A, EXAMPLE_B, EXAMPLE_EXTRA, ""])
+def test_day_03_tokenized(write_input, contents):
+    write_input(3, contents)
+    assert day_03_tokenized() == (day_03a_v2(), day_03b_v2())
+
+
+def test_tokenizer():
+    tokenizer = Tokenizer([Instruction("mul", arguments=2, max_digits=3), Instruction("do"), Instruction("add", 3)])
+    tokens = list(tokenizer.iter_tokens(b"mul(1,2)do()mul(1234,5)add(1,2,3)add(1,2)mul(12,345)"))
+    assert [(token.name, token.arguments) for token in tokens] == [
+        ("mul", (1, 2)), ("do", ()), ("add", (1, 2, 3)), ("mul", (12, 345))
+    ]
+    assert tokenizer.match_token(b"xmul(1,2)", 1) == Token("mul", (1, 2), 1, 9)
+    assert tokenizer.match_token(b"xmul(1,2)", 0) is None
+
+
+def test_iter_tokens_starting_in_tries_every_start():
+    tokenizer = Tokenizer([Instruction("add", arguments=2)])
+    memory = b"xxadd(1,2)yy"
+    assert list(iter_tokens_starting_in(memory, 0, 4, tokenizer)) == [Token("add", (1, 2), 2, 10)]
+    assert list(iter_tokens_starting_in(memory, 4, len(memory), tokenizer)) == []
@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from day_04 import day_04a, day_04a_streaming, day_04a_v2, day_04b, day_04b_streaming, iter_day_04_input
+from utilities.word_search import count_words
+
+EXAMPLE = [
+    "MMMSXXMASM",
+    "MSAMXMSMSA",
+    "AMXSXMAAMM",
+    "MSAMASMSMX",
+    "XMASAMXAMM",
+    "XXAMMXXAMA",
+    "SMSMSASXSS",
+    "SAXAMASAAA",
+    "MAMMMXMMMM",
+    "MXMXAXMASX",
+]
+
+
+def random_grid(rng: random.Random, height: int, width: int, letters: str = "XMAS") -> list[str]:
+    return ["".join(rng.choices(letters, k=width)) for __ in range(height)]
+
+
+@pytest.mark.parametrize(["day_04", "solution"], [(day_04a, 18), (day_04a_v2, 18), (day_04b, 9)])
+def test_day_04(day_04, solution):
+    assert day_04(EXAMPLE) == solution
+
+
+@pytest.mark.parametrize(["height", "width"], [(1, 1), (1, 7), (7, 1), (4, 4), (13, 29), (29, 13)])
+def test_day_04a_v2_matches_day_04a(height, width):
+    rng = random.Random(height * width)
+    grid = random_grid(rng, height, width)
+    assert day_04a_v2(grid) == day_04a(grid)
+
+
+def test_day_04b_v2():
+    pytest.importorskip("numpy")
+    from day_04 import day_04b_v2
+
+    assert day_04b_v2(EXAMPLE) == 9
+    grid = random_grid(random.Random(4), 40, 30)
+    assert day_04b_v2(grid) == day_04b(grid)
+
+
+@pytest.mark.parametrize(["height", "width"], [(1, 1), (1, 7), (7, 1), (4, 4), (13, 29), (29, 13)])
+def test_day_04_streaming(height, width):
+    rng = random.Random(height + width)
+    grid = random_grid(rng, height, width)
+    assert day_04a_streaming(iter(grid)) == day_04a(grid)
+    assert day_04b_streaming(iter(grid)) == day_04b(grid)
+
+
+def test_day_04_streaming_from_file(write_input):
+    write_input(4, "\n".join(EXAMPLE) + "\n")
+
+    assert day_04a_streaming(iter_day_04_input()) == 18
+    assert day_04b_streaming(iter_day_04_input()) == 9
+
+
+@pytest.mark.parametrize("grid", [["AAA"], ["A", "A", "A"], ["ABA", "BAB"], ["AB", "BA", "AB"]])
+def test_day_04a_streaming_counts_overlapping_words(grid):
+    assert day_04a_streaming(iter(grid), word="AA") == count_words(grid, ["AA"])["AA"]
+
+
+def test_day_04a_streaming_same_count_when_transposed():
+    assert day_04a_streaming(iter(["AAA"]), word="AA") == day_04a_streaming(iter(["A", "A", "A"]), word="AA") == 4
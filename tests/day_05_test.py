@@ -0,0 +1,161 @@
+import random
+from collections import defaultdict
+
+import pytest
+
+from day_05 import (
+    RuleStore,
+    day_05a,
+    day_05a_v2,
+    day_05b,
+    day_05b_v2,
+    get_corrected_middle_page,
+    get_day_05_input,
+    get_later_page_bitsets,
+    get_middle_page_by_rank,
+    get_page_subgraph,
+    get_pages_in_reversed_rules,
+    iter_day_05_input,
+    sort_pages,
+)
+from utilities.synthetic import get_synthetic_input
+
+EXAMPLE = """\
+47|53
+97|13
+97|61
+97|47
+75|29
+61|13
+75|53
+29|13
+97|29
+53|29
+61|53
+97|53
+61|29
+47|13
+75|47
+97|75
+47|61
+75|61
+47|29
+75|13
+53|13
+
+75,47,61,53,29
+97,61,53,29,13
+75,29,13
+75,97,47,61,53
+61,13,29
+97,13,75,29,47
+"""
+
+
+@pytest.mark.parametrize("get_input", [get_day_05_input, iter_day_05_input])
+@pytest.mark.parametrize(["day_05", "solution"], [(day_05a, 143), (day_05a_v2, 143), (day_05b, 123), (day_05b_v2, 123)])
+def test_day_05(write_input, get_input, day_05, solution):
+    write_input(5, EXAMPLE)
+    assert day_05(*get_input()) == solution
+
+
+@pytest.mark.parametrize("use_bitsets", [False, True])
+def test_day_05a_v2(use_bitsets):
+    ordering_rules, updates = get_synthetic_input(no_pages=50, no_updates=20, update_length=30)
+    assert day_05a_v2(ordering_rules, updates, use_bitsets) == day_05a(ordering_rules, updates)
+
+    partial_rules = ordering_rules[::7]  # so some pages in the updates aren't in any rules
+    assert day_05a_v2(partial_rules, updates, use_bitsets) == day_05a(partial_rules, updates)
+
+
+def test_day_05b_v2():
+    ordering_rules, updates = get_synthetic_input(no_pages=50, no_updates=20, update_length=31)
+    assert day_05b_v2(ordering_rules, updates) == day_05b(ordering_rules, updates)
+
+
+def get_rules(*pairs: tuple[int, int]) -> defaultdict[int, set[int]]:
+    pages_must_occur_after_it = defaultdict(set)
+    for a, b in pairs:
+        pages_must_occur_after_it[a].add(b)
+    return pages_must_occur_after_it
+
+
+def test_sort_pages():
+    rules = get_rules((1, 2), (2, 3), (4, 2))  # 1 and 4 both need to come first, but (4, 1) not in the update
+    assert sort_pages(get_page_subgraph([3, 2, 4], rules)) == [4, 2, 3]
+    assert get_corrected_middle_page([3, 2, 4], rules) == 2
+
+    with pytest.raises(ValueError, match="Ambiguous"):
+        sort_pages(get_page_subgraph([3, 2, 1, 4], rules))
+    with pytest.raises(ValueError, match="Ambiguous"):
+        get_corrected_middle_page([3, 2, 1, 4], rules)
+
+    cyclic_rules = get_rules((1, 2), (2, 3), (3, 1), (4, 1))
+    with pytest.raises(ValueError, match=r"Cycle in rules between pages: \[1, 2, 3\]"):
+        sort_pages(get_page_subgraph([3, 2, 1, 4], cyclic_rules))
+
+
+def test_get_corrected_middle_page_with_two_page_cycle():
+    rules = get_rules((1, 2), (2, 1), (1, 3))  # counts of later pages are distinct, but 1 and 2 form a cycle
+    with pytest.raises(ValueError, match="Cycle"):
+        get_corrected_middle_page([3, 2, 1], rules)
+    with pytest.raises(ValueError, match="Cycle"):
+        day_05b_v2([(1, 2), (2, 1), (1, 3)], [[3, 2, 1]])
+
+
+def test_get_middle_page_by_rank():
+    ordering_rules = [(1, 2), (2, 1), (1, 3), (4, 5), (5, 6), (4, 6)]
+    page_bits, later_page_bitsets = get_later_page_bitsets(ordering_rules)
+    pages_in_reversed_rules = get_pages_in_reversed_rules(get_rules(*ordering_rules))
+    assert pages_in_reversed_rules == {1, 2}
+    assert get_middle_page_by_rank([6, 4, 5], page_bits, later_page_bitsets, pages_in_reversed_rules) == 5
+    assert get_middle_page_by_rank([3, 2, 1], page_bits, later_page_bitsets, pages_in_reversed_rules) is None
+    assert get_middle_page_by_rank([6, 4, 7], page_bits, later_page_bitsets, pages_in_reversed_rules) is None
+
+
+def test_rule_store(write_input):
+    write_input(5, EXAMPLE)
+    ordering_rules, updates = get_day_05_input()
+    rule_store = RuleStore(ordering_rules, updates)
+    assert (rule_store.valid_middle_page_sum, rule_store.corrected_middle_page_sum) == (143, 123)
+
+    rule_store.remove_rule(75, 97)  # missing rule, so nothing to do
+    rule_store.add_rule(47, 53)  # existing rule, so nothing to do
+    assert (rule_store.valid_middle_page_sum, rule_store.corrected_middle_page_sum) == (143, 123)
+
+    assert rule_store.get_updates_with_pages(29, 13) == {1, 2, 4, 5}
+    rule_store.remove_rule(29, 13)
+    rule_store.add_rule(13, 29)  # so "61,13,29" becomes valid, and "97,61,53,29,13" and "75,29,13" invalid
+    assert rule_store.valid_middle_page_sum == 143 + 13 - 53 - 29
+    assert rule_store.uncorrectable_updates == set()
+
+    rule_store.add_rule(29, 13)  # with 13|29 as well, so "61,13,29" can't be corrected
+    assert 4 in rule_store.uncorrectable_updates
+
+
+def test_rule_store_matches_rebuilding():
+    rng = random.Random(0)
+    ordering_rules, updates = get_synthetic_input(no_pages=30, no_updates=20, update_length=9)
+    rules = set(ordering_rules)
+    rule_store = RuleStore(rules, updates)
+
+    saw_uncorrectable = False
+    for __ in range(200):
+        a, b = rng.choice(ordering_rules)
+        if rng.random() < 0.2:
+            a, b = b, a  # reversed rules make cycles, so some updates can't be corrected
+        if rng.random() < 0.5:
+            rules.discard((a, b))
+            rule_store.remove_rule(a, b)
+        else:
+            rules.add((a, b))
+            rule_store.add_rule(a, b)
+
+        rebuilt = RuleStore(rules, updates)
+        assert rule_store.valid_middle_page_sum == rebuilt.valid_middle_page_sum == day_05a(list(rules), updates)
+        assert rule_store.corrected_middle_page_sum == rebuilt.corrected_middle_page_sum
+        assert rule_store.uncorrectable_updates == rebuilt.uncorrectable_updates
+        assert rule_store.pages_in_reversed_rules == rebuilt.pages_in_reversed_rules
+        saw_uncorrectable |= bool(rule_store.uncorrectable_updates)
+
+    assert saw_uncorrectable
@@ -0,0 +1,116 @@
+import random
+
+import pytest
+
+from day_06 import day_06a, day_06b, does_grid_have_cycle
+from day_06_v2 import GuardMap, day_06a_v2, day_06b_parallel, day_06b_v2
+
+EXAMPLE = [
+    "....#.....",
+    ".........#",
+    "..........",
+    "..#.......",
+    ".......#..",
+    "..........",
+    ".#..^.....",
+    "........#.",
+    "#.........",
+    "......#...",
+]
+EXAMPLE_START = (6, 4)
+
+
+def to_grid(rows: list[str]) -> list[list[str]]:
+    return [list(row) for row in rows]
+
+
+def random_grid(rng: random.Random, height: int, width: int, density: float) -> tuple[list[list[str]], tuple[int, int]]:
+    grid = [["#" if rng.random() < density else "." for __ in range(width)] for __ in range(height)]
+    start_pos = rng.randrange(height), rng.randrange(width)
+    grid[start_pos[0]][start_pos[1]] = "^"
+    return grid, start_pos
+
+
+@pytest.mark.parametrize("low_memory", [False, True])
+def test_day_06_v2(low_memory):
+    assert day_06a_v2(to_grid(EXAMPLE), EXAMPLE_START) == 41
+    assert day_06b_v2(to_grid(EXAMPLE), EXAMPLE_START, low_memory) == 6
+
+
+def test_day_06a_v2_leaves_grid_unchanged():
+    grid = to_grid(EXAMPLE)
+    day_06a_v2(grid, EXAMPLE_START)
+    assert grid == to_grid(EXAMPLE)
+
+
+def test_get_next_stop():
+    guard_map = GuardMap.from_grid(to_grid(EXAMPLE))
+    assert guard_map.get_next_stop(EXAMPLE_START, 0) == ((1, 4), False)
+    assert guard_map.get_next_stop((1, 4), 1) == ((1, 8), False)
+    assert guard_map.get_next_stop((7, 7), 2) == ((9, 7), True)
+    assert guard_map.get_next_stop((6, 4), 3) == ((6, 2), False)
+    assert guard_map.get_next_stop((5, 4), 3) == ((5, 0), True)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_guard_map_matches_stepping(seed):
+    rng = random.Random(seed)
+    grid, start_pos = random_grid(rng, rng.randint(1, 12), rng.randint(1, 12), density=0.15)
+
+    has_loop = does_grid_have_cycle([row[:] for row in grid], start_pos)
+    assert GuardMap.from_grid(grid).has_loop(start_pos) == has_loop
+    assert GuardMap.from_grid(grid).has_loop(start_pos, low_memory=True) == has_loop
+    if not has_loop:
+        assert day_06a_v2(grid, start_pos) == day_06a([row[:] for row in grid], start_pos)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_day_06b_v2_matches_day_06b(seed):
+    rng = random.Random(seed)
+    size = rng.randint(1, 12)  # square, as day_06b mixes up rows and columns on other maps
+    grid, start_pos = random_grid(rng, size, size, density=0.15)
+    assert day_06b_v2(grid, start_pos) == day_06b([row[:] for row in grid], start_pos)
+
+
+def test_obstacles_added_and_removed():
+    guard_map = GuardMap.from_grid(to_grid(EXAMPLE))
+    guard_map.add_obstacle((3, 4))
+    assert guard_map.get_next_stop(EXAMPLE_START, 0) == ((4, 4), False)
+    guard_map.remove_obstacle((3, 4))
+    assert guard_map.get_next_stop(EXAMPLE_START, 0) == ((1, 4), False)
+    assert guard_map.obstacle_rows_by_col[4] == [0]
+
+
+def test_day_06b_progress(capsys):
+    calls = []
+    assert day_06b(to_grid(EXAMPLE), EXAMPLE_START, progress=lambda *args: calls.append(args)) == 6
+    assert calls == [(i, 10) for i in range(1, 11)]
+    assert capsys.readouterr().out == ""
+
+    day_06b(to_grid(EXAMPLE), EXAMPLE_START)
+    assert capsys.readouterr().out.splitlines()[0] == "Row   1 of 10"
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_day_06b_parallel(max_workers):
+    calls = []
+    assert day_06b_parallel(to_grid(EXAMPLE), EXAMPLE_START, max_workers, lambda *args: calls.append(args)) == 6
+    no_chunks = max_workers * 4
+    assert calls == [(i, no_chunks) for i in range(1, no_chunks + 1)]
+
+
+def test_has_loop_reuses_seen_states():
+    guard_map = GuardMap.from_grid(to_grid(EXAMPLE))
+    guard_map.add_obstacle((7, 6))
+    for __ in range(600):  # enough for the check number to wrap around twice
+        assert guard_map.has_loop(EXAMPLE_START)
+        assert not guard_map.has_loop((6, 0), direction=3)
+
+
+def test_has_loop_low_memory_allocates_no_seen_states():
+    guard_map = GuardMap.from_grid(to_grid(EXAMPLE))
+    guard_map.add_obstacle((7, 6))
+    assert guard_map.has_loop(EXAMPLE_START, low_memory=True)
+    assert guard_map._seen_states is None
+    assert guard_map.has_loop(EXAMPLE_START)
+    assert len(guard_map._seen_states) == 10 * 10 * 4
@@ -0,0 +1,140 @@
+import itertools
+import random
+
+import pytest
+
+from day_07 import (
+    can_be_made_true,
+    day_07a,
+    day_07a_v2,
+    day_07b,
+    day_07b_v2,
+    evaluate_chunk,
+    get_balanced_chunks,
+    get_day_07_input,
+    iter_day_07_input,
+    sum_true_equations,
+    sum_true_equations_parallel,
+)
+from utilities.operators import ADD, CONCATENATE, MULTIPLY, POWER, SUBTRACT, Operator
+
+EXAMPLE = """\
+190: 10 19
+3267: 81 40 27
+83: 17 5
+156: 15 6
+7290: 6 8 6 15
+161011: 16 10 13
+192: 17 8 14
+21037: 9 7 18 13
+292: 11 6 16 20
+"""
+
+
+@pytest.mark.parametrize("get_input", [get_day_07_input, iter_day_07_input])
+@pytest.mark.parametrize(["day_07", "solution"], [(day_07a, 3749), (day_07a_v2, 3749), (day_07b, 11387), (day_07b_v2, 11387)])
+def test_day_07(write_input, get_input, day_07, solution):
+    write_input(7, EXAMPLE)
+    assert day_07(get_input()) == solution
+
+
+@pytest.mark.parametrize("get_input", [get_day_07_input, iter_day_07_input])
+def test_day_07_input_with_big_test_values(write_input, get_input):
+    write_input(7, "12345678901234567890: 1234567890 1234567890\n")
+
+    assert list(get_input()) == [(12345678901234567890, [1234567890, 1234567890])]
+    assert day_07b_v2(get_input()) == 12345678901234567890
+
+
+def random_equations(rng: random.Random, no_equations: int, max_nums: int) -> list[tuple[int, list[int]]]:
+    """Generate equations, half made true with random operators and half with a random test value."""
+    equations = []
+    for i in range(no_equations):
+        nums = [rng.randint(1, 20) for __ in range(rng.randint(1, max_nums))]
+        test_value = nums[0]
+        for n in nums[1:]:
+            test_value = rng.choice([test_value + n, test_value * n, int(f"{test_value}{n}")])
+        equations.append((test_value if i % 2 else rng.randint(1, test_value + 1), nums))
+    return equations
+
+
+@pytest.mark.parametrize("use_dp", [False, True])
+def test_day_07_v2_matches_day_07(use_dp):
+    equations = random_equations(random.Random(0), no_equations=200, max_nums=7)
+    equations += [(test_value * 2, nums) for test_value, nums in equations]  # so prefixes are shared
+    assert day_07a_v2(equations, use_dp) == day_07a(equations)
+    assert day_07b_v2(equations, use_dp) == day_07b(equations)
+
+
+def test_can_be_made_true_with_many_nums():
+    nums = [1] * 40 + [2] * 20 + [3]
+    assert can_be_made_true(40 * 2 ** 20 * 3, nums)  # add the ones, then multiply
+    assert not can_be_made_true(40 * 2 ** 20 * 3 + 1, nums)  # one more than the largest possible
+    assert can_be_made_true(int("1" * 40 + "2" * 20 + "3"), nums, (ADD, MULTIPLY, CONCATENATE))
+
+
+@pytest.mark.parametrize(["test_value", "nums", "solution"], [(0, [5, 0], True), (0, [5, 3, 0], True), (3, [0, 3], True)])
+def test_can_be_made_true_with_zeros(test_value, nums, solution):
+    assert can_be_made_true(test_value, nums, (ADD, MULTIPLY, CONCATENATE)) == solution
+
+
+def can_be_made_true_by_brute_force(test_value: int, nums: list[int], operators: list[Operator]) -> bool:
+    for ops in itertools.product(operators, repeat=len(nums) - 1):
+        result = nums[0]
+        for op, n in zip(ops, nums[1:]):
+            result = op.forward(result, n)
+        if result == test_value:
+            return True
+    return False
+
+
+@pytest.mark.parametrize(
+    "operators", [(ADD, MULTIPLY, CONCATENATE), (ADD, SUBTRACT, MULTIPLY), (MULTIPLY, POWER), (ADD, POWER, CONCATENATE)]
+)
+def test_can_be_made_true_with_custom_operators(operators):
+    rng = random.Random(0)
+    for __ in range(300):
+        nums = [rng.randint(0, 4) for __ in range(rng.randint(1, 5))]
+        test_value = nums[0]
+        for n in nums[1:]:
+            test_value = rng.choice(operators).forward(test_value, n)
+        for value in (test_value, test_value + rng.randint(-3, 3)):
+            assert can_be_made_true(value, nums, operators) == can_be_made_true_by_brute_force(value, nums, operators)
+
+
+@pytest.mark.parametrize("operators", [(ADD, MULTIPLY, CONCATENATE), (ADD, SUBTRACT, MULTIPLY), (MULTIPLY, POWER)])
+def test_sum_true_equations_by_dp(operators):
+    rng = random.Random(1)
+    equations = [
+        (rng.randint(-5, 50), [rng.randint(0, 4) for __ in range(rng.randint(1, 5))])
+        for __ in range(500)
+    ]
+    assert sum_true_equations(equations, operators, use_dp=True) == sum_true_equations(equations, operators)
+
+
+def test_sum_true_equations_by_dp_with_big_values():
+    equations = [(10 ** 30, [10 ** 10, 10 ** 20]), (10 ** 30 + 1, [10 ** 10, 10 ** 20])]
+    assert sum_true_equations(equations, (ADD, MULTIPLY), use_dp=True) == 10 ** 30
+
+
+SLOW_EQUATION = (10 ** 6, [1] * 2000)  # false (without concatenation), but has millions of states to rule out
+
+
+def test_evaluate_chunk_with_time_limit():
+    equations = [(190, [10, 19]), SLOW_EQUATION, (83, [17, 5]), (292, [11, 6, 16, 20])]
+    assert evaluate_chunk(equations, (ADD, MULTIPLY), time_limit=0.05) == (190 + 292, [SLOW_EQUATION])
+
+
+def test_get_balanced_chunks():
+    equations = [(1, [1] * length) for length in (2, 3, 4, 5, 6, 7)]  # costs 2, 4, 8, 16, 32, 64
+    chunks = get_balanced_chunks(equations, (ADD, MULTIPLY), no_chunks=2)
+    assert [[len(nums) for __, nums in chunk] for chunk in chunks] == [[7], [6, 5, 4, 3, 2]]
+    assert len(get_balanced_chunks(equations, (ADD, MULTIPLY), no_chunks=10)) == 6
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_sum_true_equations_parallel(max_workers):
+    equations = random_equations(random.Random(0), no_equations=100, max_nums=7) + [SLOW_EQUATION]
+    operators = (ADD, MULTIPLY)
+    result = sum_true_equations_parallel(equations, operators, max_workers, time_limit=0.05)
+    assert result == (sum_true_equations(equations[:-1], operators), [SLOW_EQUATION])
@@ -0,0 +1,82 @@
+import itertools
+import random
+
+import pytest
+
+from day_08 import day_08a, day_08b
+from day_08_v2 import Location, Vector, day_08a_v2, day_08b_v2
+
+EXAMPLE = [
+    "............",
+    "........0...",
+    ".....0......",
+    ".......0....",
+    "....0.......",
+    "......A.....",
+    "............",
+    "............",
+    "........A...",
+    ".........A..",
+    "............",
+    "............",
+]
+
+
+@pytest.mark.parametrize(["day_08", "solution"], [(day_08a, 14), (day_08a_v2, 14), (day_08b, 34), (day_08b_v2, 34)])
+def test_day_08(day_08, solution):
+    assert day_08(EXAMPLE) == solution
+
+
+def test_location_and_vector_operators():
+    a, b = Location(1, 2), Location(4, 8)
+    assert b - a == Vector(3, 6)
+    assert a + Vector(3, 6) == b
+    assert Vector(3, 6) + a == b
+    assert Vector(3, 6) + Vector(1, 1) == Vector(4, 7)
+    assert Vector(3, 6) - Vector(1, 1) == Vector(2, 5)
+    assert Vector(3, 6) * 2 == Vector(6, 12)
+    assert Vector(3, 6) // 3 == Vector(1, 2)
+    assert -Vector(3, 6) == Vector(-3, -6)
+    with pytest.raises(ValueError):
+        Vector(3, 6) // 2
+    with pytest.raises(AttributeError):
+        a.row = 0
+
+
+def test_location_and_vector_reject_other_types():
+    with pytest.raises(TypeError):
+        2 * Vector(3, 6)
+    with pytest.raises(TypeError):
+        Location(1, 2) * 2
+    with pytest.raises(TypeError):
+        Location(1, 2) + Location(1, 2)
+    assert Location(1, 2) != Vector(1, 2)
+    assert Location(1, 2) != (1, 2)
+    assert len({Location(1, 2), Location(1, 2), Vector(1, 2)}) == 2
+
+
+def count_antinodes_by_brute_force(map: list[str], harmonics: bool) -> int:
+    """Check every cell against every pair of same-frequency antennae."""
+    antennae = [(item, row, col) for row, line in enumerate(map) for col, item in enumerate(line) if item != "."]
+    pairs = [(a[1:], b[1:]) for a, b in itertools.permutations(antennae, 2) if a[0] == b[0]]
+
+    count = 0
+    for row, col in itertools.product(range(len(map)), range(len(map[0]))):
+        for (row_1, col_1), (row_2, col_2) in pairs:
+            if harmonics:
+                is_antinode = (row - row_1) * (col_2 - col_1) == (col - col_1) * (row_2 - row_1)
+            else:
+                is_antinode = (row, col) == (2 * row_2 - row_1, 2 * col_2 - col_1)
+            if is_antinode:
+                count += 1
+                break
+    return count
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_day_08_v2_matches_brute_force(seed):
+    rng = random.Random(seed)
+    height, width = rng.randint(1, 15), rng.randint(1, 15)
+    map = ["".join(rng.choice("....aAb") for __ in range(width)) for __ in range(height)]
+    assert day_08a_v2(map) == count_antinodes_by_brute_force(map, harmonics=False)
+    assert day_08b_v2(map) == count_antinodes_by_brute_force(map, harmonics=True)
@@ -0,0 +1,24 @@
+import pytest
+
+from utilities.operators import concatenate, get_concat_power, get_exact_root, unconcatenate
+
+
+@pytest.mark.parametrize(["n", "power"], [(0, 10), (9, 10), (10, 100), (99, 100), (12345, 100000), (10 ** 45, 10 ** 46)])
+def test_get_concat_power(n, power):
+    assert get_concat_power(n) == power
+
+
+@pytest.mark.parametrize(["a", "b"], [(0, 0), (12, 345), (15, 0), (1, 10 ** 40), (10 ** 40, 7)])
+def test_concatenate(a, b):
+    assert concatenate(a, b) == int(f"{a}{b}")
+    assert unconcatenate(concatenate(a, b), b) == a
+
+
+def test_unconcatenate_without_matching_digits():
+    assert unconcatenate(12345, 44) is None
+    assert unconcatenate(5, 15) is None
+
+
+@pytest.mark.parametrize(["value", "n", "root"], [(0, 3, 0), (1, 5, 1), (81, 4, 3), (82, 4, None), (3 ** 100, 50, 9), (-8, 3, None)])
+def test_get_exact_root(value, n, root):
+    assert get_exact_root(value, n) == root
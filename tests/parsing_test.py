@@ -0,0 +1,87 @@
+import pytest
+
+from utilities.parsing import (
+    extract_ints, iter_int_chunks, iter_records, read_int_lines, read_ints, read_ints_as_numpy
+)
+
+MACHINES = b"""Button A: X+94, Y+34
+Button B: X+22, Y+67
+Prize: X=8400, Y=5400
+
+Button A: X+26, Y+66
+Button B: X+67, Y+21
+Prize: X=12748, Y=12176
+"""
+
+
+def test_extract_ints():
+    assert extract_ints(b"p=0,4 v=3,-3\n-12|7").tolist() == [0, 4, 3, -3, -12, 7]
+
+
+def test_read_ints_records(tmp_path):
+    filepath = tmp_path / "input.txt"
+    filepath.write_bytes(MACHINES)
+
+    values = read_ints(filepath, fields=6)
+    assert list(iter_records(values, 6)) == [(94, 34, 22, 67, 8400, 5400), (26, 66, 67, 21, 12748, 12176)]
+
+
+def test_read_ints_wrong_field_count(tmp_path):
+    filepath = tmp_path / "input.txt"
+    filepath.write_bytes(MACHINES)
+
+    with pytest.raises(ValueError):
+        read_ints(filepath, fields=5)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 16])
+def test_iter_int_chunks(tmp_path, chunk_size):
+    filepath = tmp_path / "input.txt"
+    filepath.write_bytes(MACHINES)
+
+    chunks = list(iter_int_chunks(filepath, fields=6, chunk_size=chunk_size))
+    assert all(len(chunk) % 6 == 0 for chunk in chunks)
+    assert [x for chunk in chunks for x in chunk] == read_ints(filepath).tolist()
+
+
+def test_read_int_lines(tmp_path):
+    filepath = tmp_path / "input.txt"
+    filepath.write_bytes(b"47|53\n97|13\n\n75,47,61,53,29\n")
+
+    assert [line.tolist() for line in read_int_lines(filepath)] == [[47, 53], [97, 13], [], [75, 47, 61, 53, 29]]
+
+
+def test_read_int_lines_as_lists(tmp_path):
+    filepath = tmp_path / "input.txt"
+    filepath.write_bytes(b"12345678901234567890: 1 2\n")
+
+    with pytest.raises(OverflowError):
+        read_int_lines(filepath)
+    assert read_int_lines(filepath, as_lists=True) == [[12345678901234567890, 1, 2]]
+
+
+@pytest.mark.parametrize("contents", [b"3   4\n-4   3\n", b"3,4\n-4,3\n"])
+def test_read_ints_as_numpy(tmp_path, contents):
+    pytest.importorskip("numpy")
+    filepath = tmp_path / "input.txt"
+    filepath.write_bytes(contents)
+
+    assert read_ints_as_numpy(filepath, fields=2).tolist() == [[3, 4], [-4, 3]]
+
+
+@pytest.mark.parametrize("contents", [b"3-4 5\n", b"- 3\n", b"3 -\n", b"9223372036854775807 1\n"])
+def test_read_ints_as_numpy_matches_read_ints(tmp_path, contents):
+    pytest.importorskip("numpy")
+    filepath = tmp_path / "input.txt"
+    filepath.write_bytes(contents)
+
+    assert read_ints_as_numpy(filepath).ravel().tolist() == read_ints(filepath).tolist()
+
+
+def test_read_ints_as_numpy_too_big(tmp_path):
+    pytest.importorskip("numpy")
+    filepath = tmp_path / "input.txt"
+    filepath.write_bytes(b"99999999999999999999\n")
+
+    with pytest.raises(OverflowError):
+        read_ints_as_numpy(filepath)
@@ -0,0 +1,24 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from utilities.stencil import Stencil, count_stencil_matches, locate_stencil_matches, to_letter_array
+
+
+def test_variants():
+    stencil = Stencil(["AB", ".C"])
+    assert stencil.rotate() == Stencil([".A", "CB"])
+    assert stencil.reflect() == Stencil(["BA", "C."])
+    assert len(stencil.variants()) == 8
+    assert len(Stencil(["A.A", ".A.", "A.A"]).variants()) == 1
+
+
+def test_locate_stencil_matches():
+    letters = to_letter_array(["ABAB", "XCYC", "ABQB"])
+    stencil = Stencil(["AB", ".C"])
+    assert locate_stencil_matches(letters, [stencil]) == [(stencil, 0, 0), (stencil, 0, 2)]
+    assert count_stencil_matches(letters, stencil.variants()) == 4  # plus one each for "BA", "C." and ".C", "AB"
+
+
+def test_stencil_larger_than_grid():
+    assert count_stencil_matches(to_letter_array(["AB"]), [Stencil(["A", "B"])]) == 0
@@ -0,0 +1,40 @@
+import pytest
+
+from utilities.word_search import count_words, find_words
+
+GRID = [
+    "ABCD",
+    "EFGH",
+    "IJKL",
+]
+
+
+@pytest.mark.parametrize(["word", "row", "col", "direction"], [
+    ("ABC", 0, 0, (0, 1)),
+    ("CBA", 0, 2, (0, -1)),
+    ("AEI", 0, 0, (1, 0)),
+    ("LHD", 2, 3, (-1, 0)),
+    ("AFK", 0, 0, (1, 1)),
+    ("LGB", 2, 3, (-1, -1)),
+    ("DGJ", 0, 3, (1, -1)),
+    ("IFC", 2, 0, (-1, 1)),
+])
+def test_find_words_in_each_direction(word, row, col, direction):
+    assert list(find_words(GRID, [word])) == [(word, row, col, direction)]
+
+
+def test_find_words_coordinates_spell_words():
+    grid = ["XMASAMX", "MMSAXSA", "AMAMMAM", "SXSAXMX"]
+    matches = list(find_words(grid, ["XMAS", "AM", "SAMX", "MAX"]))
+    assert matches
+    for word, row, col, (row_step, col_step) in matches:
+        assert "".join(grid[row + i * row_step][col + i * col_step] for i in range(len(word))) == word
+
+
+def test_count_words_overlapping_and_palindromes():
+    assert count_words(["AAAA"], ["AA", "AAA"]) == {"AA": 6, "AAA": 4}  # each occurrence found in both directions
+
+
+@pytest.mark.parametrize("grid", [[], [""], ["", ""]])
+def test_count_words_empty_grid(grid):
+    assert count_words(grid, ["XMAS"]) == {}